@@ -1,17 +1,44 @@
 # analyst_ratings.py
 
+import functools
+from bisect import bisect_left
 from typing import NamedTuple
 
 
 class RatingResult(NamedTuple):
     """
     An analyst rating display label with its associated colour.
+
+    The coerced field carries the rating as a float when the raw value is
+    numeric, so callers can display it without converting again.
     """
 
     label: str
     color: str
-
-
+    coerced: float | None = None
+
+
+_EXACT_RATINGS: dict[str, RatingResult] = {
+    "strong buy": RatingResult("Strong Buy", "#15803d"),
+    "buy": RatingResult("Buy", "#16a34a"),
+    "hold": RatingResult("Hold", "#d97706"),
+    "neutral": RatingResult("Hold", "#d97706"),
+    "strong sell": RatingResult("Strong Sell", "#991b1b"),
+    "sell": RatingResult("Sell", "#dc2626"),
+    "underperform": RatingResult("Sell", "#dc2626"),
+}
+
+_NUMERIC_THRESHOLDS: tuple[float, ...] = (1.5, 2.5, 3.5, 4.5)
+_NUMERIC_RESULTS: tuple[RatingResult, ...] = (
+    RatingResult("Strong Buy", "#15803d"),
+    RatingResult("Buy", "#16a34a"),
+    RatingResult("Hold", "#d97706"),
+    RatingResult("Sell", "#dc2626"),
+    RatingResult("Strong Sell", "#991b1b"),
+)
+
+
+@functools.lru_cache(maxsize=4096)
 def analyst_rating_label(
     value: str | float | None,
 ) -> RatingResult:
@@ -22,7 +49,7 @@ def analyst_rating_label(
         value: Raw analyst rating from the data source.
 
     Returns:
-        RatingResult: A namedtuple with .label and .color fields.
+        RatingResult: A namedtuple with .label, .color and .coerced fields.
     """
     if value is None:
         return RatingResult("N/A", "#808495")
@@ -35,6 +62,9 @@ def _match_string_rating(value: str) -> RatingResult:
     """
     Map a string rating to a label and colour via pattern matching.
 
+    Canonical ratings resolve with a single dict lookup; only unrecognised
+    strings fall back to the substring scan.
+
     Args:
         value: Raw string rating (e.g. "Strong Buy", "HOLD").
 
@@ -42,6 +72,9 @@ def _match_string_rating(value: str) -> RatingResult:
         RatingResult: The matched label and colour.
     """
     lowered = value.strip().lower()
+    exact = _EXACT_RATINGS.get(lowered)
+    if exact is not None:
+        return exact
     patterns = (
         ("strong buy", "Strong Buy", "#15803d"),
         ("buy", "Buy", "#16a34a"),
@@ -54,7 +87,7 @@ def _match_string_rating(value: str) -> RatingResult:
     for pattern, label, color in patterns:
         if pattern in lowered:
             return RatingResult(label, color)
-    return RatingResult(value, "#808495")
+    return RatingResult(value, "#808495", _try_float(value))
 
 
 def _coerce_numeric_rating(value: float) -> RatingResult:
@@ -67,29 +100,40 @@ def _coerce_numeric_rating(value: float) -> RatingResult:
     Returns:
         RatingResult: From threshold lookup, or fallback on error.
     """
+    coerced = _try_float(value)
+    if coerced is None:
+        return RatingResult(str(value), "#808495")
+    return _match_numeric_rating(coerced)
+
+
+def _try_float(value: str | float) -> float | None:
+    """
+    Convert a value to float, returning None when it is not numeric.
+
+    Args:
+        value: A numeric-like value to convert.
+
+    Returns:
+        float | None: The converted value, or None on failure.
+    """
     try:
-        return _match_numeric_rating(float(value))
+        return float(value)
     except (ValueError, TypeError):
-        return RatingResult(str(value), "#808495")
+        return None
 
 
 def _match_numeric_rating(value: float) -> RatingResult:
     """
     Map a numeric rating to a label and colour via threshold lookup.
 
+    Each threshold is an inclusive upper bound, so bisect_left selects the
+    first band whose bound is not below the value.
+
     Args:
         value: Numeric rating (typically 1.0-5.0 scale).
 
     Returns:
-        RatingResult: The matched label and colour.
+        RatingResult: The matched label and colour, carrying the value.
     """
-    thresholds = (
-        (1.5, "Strong Buy", "#15803d"),
-        (2.5, "Buy", "#16a34a"),
-        (3.5, "Hold", "#d97706"),
-        (4.5, "Sell", "#dc2626"),
-    )
-    for threshold, label, color in thresholds:
-        if value <= threshold:
-            return RatingResult(label, color)
-    return RatingResult("Strong Sell", "#991b1b")
+    result = _NUMERIC_RESULTS[bisect_left(_NUMERIC_THRESHOLDS, value)]
+    return result._replace(coerced=value)
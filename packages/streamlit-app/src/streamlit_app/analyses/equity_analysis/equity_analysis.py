@@ -9,22 +9,22 @@ from streamlit_app.analyses.equity_analysis.renderers import (
     render_metrics_banner,
 )
 from streamlit_app.analyses.equity_analysis.tradingview import (
-    fetch_logo,
     render_chart,
     resolve_tv_symbol,
 )
+from streamlit_app.dashboards.universe.equity_data_provider import get_equity_row
 
 # Session state guard
-data = st.session_state.get("selected_equity_data")
+figi = st.session_state.get("selected_equity_figi")
 name = st.session_state.get("selected_equity_name")
+data = get_equity_row(figi) if figi else None
 
 if not data or not name:
     st.info("Select an equity from the Universe table to view its analysis.")
     st.stop()
 
 # Resolve TradingView data
-tv_symbol = resolve_tv_symbol(data.get("Symbol", ""), name, data.get("MICs"))
-tv_logoid = fetch_logo(tv_symbol)
+tv_symbol, tv_logoid = resolve_tv_symbol(data.get("Symbol", ""), name, data.get("MICs"))
 
 # Page layout
 render_header(name, tv_logoid, data)
@@ -1,11 +1,58 @@
 # formatters.py
 
+import functools
+import math
+from bisect import bisect_right
+from collections.abc import Callable
+
+_CURRENCY_BOUNDS: tuple[float, ...] = (1e6, 1e9, 1e12)
+_CURRENCY_TIERS: tuple[tuple[float, str], ...] = (
+    (1e6, "M"),
+    (1e9, "B"),
+    (1e12, "T"),
+)
+
+_LARGE_NUMBER_BOUNDS: tuple[float, ...] = (1e3, 1e6, 1e9)
+_LARGE_NUMBER_TIERS: tuple[tuple[float, str, str], ...] = (
+    (1e3, "K", ".1f"),
+    (1e6, "M", ".2f"),
+    (1e9, "B", ".2f"),
+)
+
+
+def _memoise(func: Callable[..., str]) -> Callable[..., str]:
+    """
+    Memoise a formatter on its exact argument values.
+
+    Note:
+        Zero is formatted uncached, since -0.0 and 0.0 (and 0) share a
+        cache key yet render differently, so a cached result would depend
+        on call order. Arguments are otherwise cached by type as well.
+
+    Args:
+        func: Formatter taking the value to format as its first argument.
+
+    Returns:
+        Callable[..., str]: The memoised formatter.
+    """
+    cached = functools.lru_cache(maxsize=4096, typed=True)(func)
+
+    @functools.wraps(func)
+    def wrapper(value: object, *args: object, **kwargs: object) -> str:
+        if isinstance(value, float) and value == 0:
+            return func(value, *args, **kwargs)
+        return cached(value, *args, **kwargs)
+
+    return wrapper
+
 
+@_memoise
 def fmt_currency(value: float | None) -> str:
     """
     Format a numeric value as a dollar currency string.
 
-    Large values are abbreviated with T/B/M suffixes.
+    Large values are abbreviated with T/B/M suffixes, with the tier chosen
+    by a binary search over the magnitude bounds.
 
     Args:
         value: Numeric value to format, or None.
@@ -15,12 +62,14 @@ def fmt_currency(value: float | None) -> str:
     """
     if value is None:
         return "N/A"
-    for divisor, suffix in ((1e12, "T"), (1e9, "B"), (1e6, "M")):
-        if abs(value) >= divisor:
-            return f"${value / divisor:.2f}{suffix}"
-    return f"${value:,.2f}"
+    tier = bisect_right(_CURRENCY_BOUNDS, abs(value))
+    if not tier or math.isnan(value):
+        return f"${value:,.2f}"
+    divisor, suffix = _CURRENCY_TIERS[tier - 1]
+    return f"${value / divisor:.2f}{suffix}"
 
 
+@_memoise
 def fmt_pct(value: float | None) -> str:
     """
     Format a decimal ratio as a percentage string.
@@ -38,6 +87,7 @@ def fmt_pct(value: float | None) -> str:
     return f"{value * 100:.2f}%"
 
 
+@_memoise
 def fmt_number(value: float | str | None, decimals: int = 2) -> str:
     """
     Format a numeric value with thousands separators.
@@ -57,6 +107,7 @@ def fmt_number(value: float | str | None, decimals: int = 2) -> str:
         return str(value)
 
 
+@_memoise
 def fmt_large_number(value: float | None) -> str:
     """
     Format a large number with B/M/K abbreviations.
@@ -69,13 +120,14 @@ def fmt_large_number(value: float | None) -> str:
     """
     if value is None:
         return "N/A"
-    tiers = ((1e9, "B", ".2f"), (1e6, "M", ".2f"), (1e3, "K", ".1f"))
-    for divisor, suffix, fmt in tiers:
-        if abs(value) >= divisor:
-            return f"{value / divisor:{fmt}}{suffix}"
-    return f"{value:,.0f}"
+    tier = bisect_right(_LARGE_NUMBER_BOUNDS, abs(value))
+    if not tier or math.isnan(value):
+        return f"{value:,.0f}"
+    divisor, suffix, fmt = _LARGE_NUMBER_TIERS[tier - 1]
+    return f"{value / divisor:{fmt}}{suffix}"
 
 
+@_memoise
 def fmt_ratio(value: float | str | None) -> str:
     """
     Format a ratio value with 'x' suffix (e.g. '15.2x').
@@ -6,6 +6,23 @@ from streamlit.delta_generator import DeltaGenerator
 
 from streamlit_app.analyses.equity_analysis.formatters import fmt_pct
 
+_LABEL_STYLE: str = (
+    "font-size:0.82rem;"
+    "color:rgb(120,120,120);"
+    "font-weight:400;"
+    'font-family:"Source Sans Pro",sans-serif;'
+    "line-height:1.6;"
+)
+_VALUE_STYLE: str = (
+    "font-size:2.25rem;"
+    "font-weight:400;"
+    'font-family:"Source Sans Pro",sans-serif;'
+    "line-height:1.2;"
+)
+_SUB_STYLE: str = (
+    'font-size:0.75rem;color:rgb(120,120,120);font-family:"Source Sans Pro",sans-serif;'
+)
+
 
 def render_colored_pct_metric(
     container: DeltaGenerator,
@@ -28,24 +45,36 @@ def render_colored_pct_metric(
     else:
         formatted = fmt_pct(value)
         color = "#16a34a" if value >= 0 else "#dc2626"
-    label_style = (
-        "font-size:0.82rem;"
-        "color:rgb(120,120,120);"
-        "font-weight:400;"
-        'font-family:"Source Sans Pro",sans-serif;'
-        "line-height:1.6;"
-    )
-    value_style = (
-        "font-size:2.25rem;"
-        "font-weight:400;"
-        'font-family:"Source Sans Pro",sans-serif;'
-        "line-height:1.2;"
-    )
+    render_colored_metric(container, label, formatted, color)
+
+
+def render_colored_metric(
+    container: DeltaGenerator,
+    label: str,
+    value: str,
+    color: str,
+    sub: str | None = None,
+) -> None:
+    """
+    Render a pre-formatted metric value in the given colour.
+
+    Matches st.metric styling, with an optional muted line beneath the
+    value.
+
+    Args:
+        container: Streamlit column or container to render into.
+        label: The metric label text.
+        value: The formatted value text.
+        color: CSS colour for the value.
+        sub: Optional text shown beneath the value.
+    """
+    sub_html = f'<div style="{_SUB_STYLE}">{sub}</div>' if sub is not None else ""
     container.markdown(
         f"<div>"
-        f'<label style="{label_style}">{label}</label>'
-        f'<div style="{value_style}color:{color};">'
-        f"{formatted}</div>"
+        f'<label style="{_LABEL_STYLE}">{label}</label>'
+        f'<div style="{_VALUE_STYLE}color:{color};">'
+        f"{value}</div>"
+        f"{sub_html}"
         f"</div>",
         unsafe_allow_html=True,
     )
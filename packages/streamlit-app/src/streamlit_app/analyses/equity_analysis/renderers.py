@@ -1,8 +1,9 @@
 # renderers.py
 
-import contextlib
-from typing import Any
+from collections.abc import Callable
+from typing import Any, NamedTuple
 
+import pandas as pd
 import streamlit as st
 from streamlit.delta_generator import DeltaGenerator
 
@@ -17,6 +18,7 @@ from streamlit_app.analyses.equity_analysis.formatters import (
     fmt_ratio,
 )
 from streamlit_app.analyses.equity_analysis.html_components import (
+    render_colored_metric,
     render_colored_pct_metric,
 )
 from streamlit_app.analyses.equity_analysis.tradingview import (
@@ -24,6 +26,125 @@ from streamlit_app.analyses.equity_analysis.tradingview import (
     render_profile,
 )
 
+_SECTOR_STYLE: str = (
+    "background-color:#4f46e5;padding:3px 10px;"
+    "border-radius:12px;font-size:0.75em;color:#ffffff;"
+    "margin-left:8px;display:inline-block;vertical-align:baseline;"
+)
+_INDUSTRY_STYLE: str = (
+    "background-color:#0d9488;padding:3px 10px;"
+    "border-radius:12px;font-size:0.75em;color:#ffffff;"
+    "margin-left:8px;display:inline-block;vertical-align:baseline;"
+)
+_BADGE_SECTOR_PREFIX: str = f'<span style="{_SECTOR_STYLE}">'
+_BADGE_INDUSTRY_PREFIX: str = f'<span style="{_INDUSTRY_STYLE}">'
+_BADGE_SUFFIX: str = "</span>"
+
+
+class MetricSpec(NamedTuple):
+    """
+    A detail-tab metric: display label, row key, and value formatter.
+
+    A formatter of None renders the value as a colour-coded percentage.
+    """
+
+    label: str
+    key: str
+    formatter: Callable[[Any], str] | None
+
+
+_VALUATION_SPECS: tuple[tuple[MetricSpec, ...], ...] = (
+    (
+        MetricSpec("Trailing P/E", "Trailing P/E", fmt_ratio),
+        MetricSpec("Price/Book", "Price/Book", fmt_ratio),
+        MetricSpec("Trailing EPS", "Trailing EPS", fmt_currency),
+        MetricSpec("Dividend Yield", "Dividend Yield", fmt_pct),
+    ),
+    (
+        MetricSpec("Market Volume", "Market Volume", fmt_large_number),
+        MetricSpec("Revenue/Share", "Revenue/Share", fmt_currency),
+        MetricSpec("52W Min", "52W Min", fmt_currency),
+        MetricSpec("52W Max", "52W Max", fmt_currency),
+    ),
+)
+
+_PROFITABILITY_SPECS: tuple[tuple[MetricSpec, ...], ...] = (
+    (
+        MetricSpec("Profit Margin", "Profit Margin", None),
+        MetricSpec("Gross Margin", "Gross Margin", None),
+        MetricSpec("Operating Margin", "Operating Margin", None),
+        MetricSpec("ROE", "ROE", None),
+    ),
+    (
+        MetricSpec("ROA", "ROA", None),
+        MetricSpec("1Y Performance", "1Y Performance", None),
+    ),
+)
+
+_OWNERSHIP_SPECS: tuple[tuple[MetricSpec, ...], ...] = (
+    (
+        MetricSpec("Held by Insiders", "Held Insiders", fmt_pct),
+        MetricSpec("Held by Institutions", "Held Institutions", fmt_pct),
+        MetricSpec("Short Interest", "Short Interest", fmt_large_number),
+        MetricSpec("Share Float", "Share Float", fmt_large_number),
+    ),
+    (
+        MetricSpec("Shares Outstanding", "Shares Outstanding", fmt_large_number),
+        MetricSpec("Market Cap", "Market Cap", fmt_currency),
+    ),
+)
+
+_FINANCIALS_SPECS: tuple[tuple[MetricSpec, ...], ...] = (
+    (
+        MetricSpec("Revenue", "Revenue", fmt_currency),
+        MetricSpec("EBITDA", "EBITDA", fmt_currency),
+        MetricSpec("Total Debt", "Total Debt", fmt_currency),
+        MetricSpec("Free Cash Flow", "Free Cash Flow", fmt_currency),
+    ),
+    (
+        MetricSpec("Operating Cash Flow", "Operating Cash Flow", fmt_currency),
+        MetricSpec("Revenue/Share", "Revenue/Share", fmt_currency),
+    ),
+)
+
+_ID_FIELDS: tuple[str, ...] = (
+    "Symbol",
+    "Share Class FIGI",
+    "ISIN",
+    "CUSIP",
+    "CIK",
+    "LEI",
+    "MICs",
+    "Currency",
+)
+
+_RANGE_MUTED: str = "#808495"
+_RANGE_TRACK: str = "#e6e9ef"
+_RANGE_FILL: str = "#16a34a"
+_RANGE_TEXT: str = "#31333F"
+_RANGE_BAR_TEMPLATE: str = (
+    '<div style="padding:8px 0 24px 0;">'
+    '<div style="display:flex;justify-content:space-between;'
+    f'font-size:0.8em;color:{_RANGE_MUTED};margin-bottom:6px;">'
+    "<span>{low}</span>"
+    "<span>{high}</span></div>"
+    '<div style="position:relative;height:10px;'
+    f"background:{_RANGE_TRACK};border-radius:5px;"
+    'overflow:visible;">'
+    '<div style="height:100%;width:{pct}%;'
+    f"background:{_RANGE_FILL};"
+    'border-radius:5px;"></div>'
+    '<div style="position:absolute;top:-4px;left:{pct}%;'
+    "transform:translateX(-50%);width:4px;height:18px;"
+    f"background:{_RANGE_TEXT};"
+    'border-radius:2px;"></div></div>'
+    '<div style="position:relative;height:20px;">'
+    '<div style="position:absolute;left:{pct}%;'
+    "transform:translateX(-50%);font-size:0.75em;"
+    f'font-weight:600;color:{_RANGE_TEXT};margin-top:4px;">'
+    "{price}</div></div></div>"
+)
+
 
 def render_header(
     name: str,
@@ -33,6 +154,9 @@ def render_header(
     """
     Render the equity page header with logo, name, symbol, and badges.
 
+    The logo, name, symbol and badges are emitted as a single markdown
+    element, followed by a divider.
+
     Args:
         name: The equity display name.
         logoid: TradingView logo identifier, or None if unavailable.
@@ -45,18 +169,14 @@ def render_header(
             f'<img src="{url}" width="36" height="36"'
             f' style="vertical-align:middle;margin-right:10px;">'
         )
-    st.markdown(
-        f'<div style="display:flex;align-items:center;">'
-        f"{logo_img}"
-        f'<span style="font-size:1.75em;font-weight:700;">'
-        f"{name}</span></div>",
-        unsafe_allow_html=True,
-    )
-
     symbol = data.get("Symbol", "")
     left = f"<strong>{symbol}</strong>" if symbol else ""
     badges = _badge_html(data)
     st.markdown(
+        f'<div style="display:flex;align-items:center;">'
+        f"{logo_img}"
+        f'<span style="font-size:1.75em;font-weight:700;">'
+        f"{name}</span></div>"
         f'<div style="display:flex;align-items:baseline;'
         f'font-size:0.85em;">'
         f"<span>{left}</span>"
@@ -149,23 +269,13 @@ def _badge_html(data: dict[str, Any]) -> str:
     Returns:
         str: Concatenated HTML badge string.
     """
-    sector_style = (
-        "background-color:#4f46e5;padding:3px 10px;"
-        "border-radius:12px;font-size:0.75em;color:#ffffff;"
-        "margin-left:8px;display:inline-block;vertical-align:baseline;"
-    )
-    industry_style = (
-        "background-color:#0d9488;padding:3px 10px;"
-        "border-radius:12px;font-size:0.75em;color:#ffffff;"
-        "margin-left:8px;display:inline-block;vertical-align:baseline;"
-    )
     parts: list[str] = []
     sector = data.get("Sector", "")
     if sector:
-        parts.append(f'<span style="{sector_style}">{sector}</span>')
+        parts.append(_BADGE_SECTOR_PREFIX + sector + _BADGE_SUFFIX)
     industry = data.get("Industry", "")
     if industry:
-        parts.append(f'<span style="{industry_style}">{industry}</span>')
+        parts.append(_BADGE_INDUSTRY_PREFIX + industry + _BADGE_SUFFIX)
     return "".join(parts)
 
 
@@ -205,32 +315,9 @@ def _render_analyst_rating(
         col: Streamlit column to render into.
         rating_val: Raw analyst rating value from the data source.
     """
-    label, color = analyst_rating_label(rating_val)
-    rating_number = ""
-    if rating_val is not None:
-        with contextlib.suppress(ValueError, TypeError):
-            rating_number = fmt_number(float(rating_val), 1)
-    label_style = (
-        "font-size:0.82rem;color:rgb(120,120,120);font-weight:400;"
-        'font-family:"Source Sans Pro",sans-serif;line-height:1.6;'
-    )
-    value_style = (
-        "font-size:2.25rem;font-weight:400;"
-        'font-family:"Source Sans Pro",sans-serif;line-height:1.2;'
-    )
-    sub_style = (
-        "font-size:0.75rem;color:rgb(120,120,120);"
-        'font-family:"Source Sans Pro",sans-serif;'
-    )
-    col.markdown(
-        f"<div>"
-        f'<label style="{label_style}">Analyst Rating</label>'
-        f'<div style="{value_style}color:{color};">'
-        f"{label}</div>"
-        f'<div style="{sub_style}">{rating_number}</div>'
-        f"</div>",
-        unsafe_allow_html=True,
-    )
+    label, color, coerced = analyst_rating_label(rating_val)
+    rating_number = fmt_number(coerced, 1) if coerced is not None else ""
+    render_colored_metric(col, "Analyst Rating", label, color, rating_number)
 
 
 def _range_bar_html(
@@ -251,31 +338,11 @@ def _range_bar_html(
     Returns:
         str: HTML string for the range bar visualisation.
     """
-    muted = "#808495"
-    track = "#e6e9ef"
-    fill = "#16a34a"
-    text = "#31333F"
-    return (
-        f'<div style="padding:8px 0 24px 0;">'
-        f'<div style="display:flex;justify-content:space-between;'
-        f'font-size:0.8em;color:{muted};margin-bottom:6px;">'
-        f"<span>{fmt_currency(low)}</span>"
-        f"<span>{fmt_currency(high)}</span></div>"
-        f'<div style="position:relative;height:10px;'
-        f"background:{track};border-radius:5px;"
-        f'overflow:visible;">'
-        f'<div style="height:100%;width:{pct:.1f}%;'
-        f"background:{fill};"
-        f'border-radius:5px;"></div>'
-        f'<div style="position:absolute;top:-4px;left:{pct:.1f}%;'
-        f"transform:translateX(-50%);width:4px;height:18px;"
-        f"background:{text};"
-        f'border-radius:2px;"></div></div>'
-        f'<div style="position:relative;height:20px;">'
-        f'<div style="position:absolute;left:{pct:.1f}%;'
-        f"transform:translateX(-50%);font-size:0.75em;"
-        f'font-weight:600;color:{text};margin-top:4px;">'
-        f"{fmt_currency(price)}</div></div></div>"
+    return _RANGE_BAR_TEMPLATE.format(
+        low=fmt_currency(low),
+        high=fmt_currency(high),
+        price=fmt_currency(price),
+        pct=f"{pct:.1f}",
     )
 
 
@@ -286,17 +353,7 @@ def _render_tab_valuation(data: dict[str, Any]) -> None:
     Args:
         data: Row dict from the Universe grid.
     """
-    c1, c2, c3, c4 = st.columns(4)
-    c1.metric("Trailing P/E", fmt_ratio(data.get("Trailing P/E")))
-    c2.metric("Price/Book", fmt_ratio(data.get("Price/Book")))
-    c3.metric("Trailing EPS", fmt_currency(data.get("Trailing EPS")))
-    c4.metric("Dividend Yield", fmt_pct(data.get("Dividend Yield")))
-    st.markdown("")
-    c5, c6, c7, c8 = st.columns(4)
-    c5.metric("Market Volume", fmt_large_number(data.get("Market Volume")))
-    c6.metric("Revenue/Share", fmt_currency(data.get("Revenue/Share")))
-    c7.metric("52W Min", fmt_currency(data.get("52W Min")))
-    c8.metric("52W Max", fmt_currency(data.get("52W Max")))
+    _render_metric_grid(data, _VALUATION_SPECS)
 
 
 def _render_tab_profitability(data: dict[str, Any]) -> None:
@@ -306,15 +363,7 @@ def _render_tab_profitability(data: dict[str, Any]) -> None:
     Args:
         data: Row dict from the Universe grid.
     """
-    c1, c2, c3, c4 = st.columns(4)
-    render_colored_pct_metric(c1, "Profit Margin", data.get("Profit Margin"))
-    render_colored_pct_metric(c2, "Gross Margin", data.get("Gross Margin"))
-    render_colored_pct_metric(c3, "Operating Margin", data.get("Operating Margin"))
-    render_colored_pct_metric(c4, "ROE", data.get("ROE"))
-    st.markdown("")
-    c5, c6 = st.columns(2)
-    render_colored_pct_metric(c5, "ROA", data.get("ROA"))
-    render_colored_pct_metric(c6, "1Y Performance", data.get("1Y Performance"))
+    _render_metric_grid(data, _PROFITABILITY_SPECS)
 
 
 def _render_tab_ownership(data: dict[str, Any]) -> None:
@@ -324,15 +373,7 @@ def _render_tab_ownership(data: dict[str, Any]) -> None:
     Args:
         data: Row dict from the Universe grid.
     """
-    c1, c2, c3, c4 = st.columns(4)
-    c1.metric("Held by Insiders", fmt_pct(data.get("Held Insiders")))
-    c2.metric("Held by Institutions", fmt_pct(data.get("Held Institutions")))
-    c3.metric("Short Interest", fmt_large_number(data.get("Short Interest")))
-    c4.metric("Share Float", fmt_large_number(data.get("Share Float")))
-    st.markdown("")
-    c5, c6 = st.columns(2)
-    c5.metric("Shares Outstanding", fmt_large_number(data.get("Shares Outstanding")))
-    c6.metric("Market Cap", fmt_currency(data.get("Market Cap")))
+    _render_metric_grid(data, _OWNERSHIP_SPECS)
 
 
 def _render_tab_financials(data: dict[str, Any]) -> None:
@@ -342,36 +383,59 @@ def _render_tab_financials(data: dict[str, Any]) -> None:
     Args:
         data: Row dict from the Universe grid.
     """
-    c1, c2, c3, c4 = st.columns(4)
-    c1.metric("Revenue", fmt_currency(data.get("Revenue")))
-    c2.metric("EBITDA", fmt_currency(data.get("EBITDA")))
-    c3.metric("Total Debt", fmt_currency(data.get("Total Debt")))
-    c4.metric("Free Cash Flow", fmt_currency(data.get("Free Cash Flow")))
-    st.markdown("")
-    c5, c6 = st.columns(2)
-    c5.metric("Operating Cash Flow", fmt_currency(data.get("Operating Cash Flow")))
-    c6.metric("Revenue/Share", fmt_currency(data.get("Revenue/Share")))
+    _render_metric_grid(data, _FINANCIALS_SPECS)
+
+
+def _render_metric_grid(
+    data: dict[str, Any],
+    specs: tuple[tuple[MetricSpec, ...], ...],
+) -> None:
+    """
+    Render rows of metrics described by a spec table, one column per spec.
+
+    Args:
+        data: Row dict from the Universe grid.
+        specs: Rows of metric specs, rendered top to bottom.
+    """
+    for row_idx, row in enumerate(specs):
+        if row_idx:
+            st.markdown("")
+        for col, (label, key, formatter) in zip(st.columns(len(row)), row, strict=True):
+            if formatter is None:
+                render_colored_pct_metric(col, label, data.get(key))
+            else:
+                col.metric(label, formatter(data.get(key)))
 
 
 def _render_tab_identifiers(data: dict[str, Any]) -> None:
     """
     Render the Identifiers tab as a two-column table.
 
+    Only missing or empty values are shown as "N/A"; falsy identifiers such
+    as 0 are displayed as-is.
+
     Args:
         data: Row dict from the Universe grid.
     """
-    fields = (
-        "Symbol",
-        "Share Class FIGI",
-        "ISIN",
-        "CUSIP",
-        "CIK",
-        "LEI",
-        "MICs",
-        "Currency",
+    values = tuple(
+        v if (v := data.get(f)) not in (None, "") else "N/A" for f in _ID_FIELDS
+    )
+    st.dataframe(
+        _build_identifiers_df(values),
+        use_container_width=True,
+        hide_index=True,
     )
-    id_data = {
-        "Field": list(fields),
-        "Value": [data.get(f) or "N/A" for f in fields],
-    }
-    st.dataframe(id_data, use_container_width=True, hide_index=True)
+
+
+@st.cache_data(show_spinner=False)
+def _build_identifiers_df(values: tuple[str, ...]) -> pd.DataFrame:
+    """
+    Build the identifiers table, cached on the identifier values.
+
+    Args:
+        values: Display values aligned with the identifier field names.
+
+    Returns:
+        pd.DataFrame: Two-column Field/Value table.
+    """
+    return pd.DataFrame({"Field": _ID_FIELDS, "Value": values})
@@ -1,23 +1,152 @@
 # tradingview.py
 
+import atexit
+import functools
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, NamedTuple
 
-import httpx
 import streamlit as st
 import streamlit.components.v1 as components
 
+if TYPE_CHECKING:
+    import httpx
+
+_PROBE_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix="tv-scan")
+_SCANNER_LOCK = threading.Lock()
+
+_SCAN_COLUMNS: tuple[str, ...] = ("name", "description", "volume", "logoid")
+_LOGOID_INDEX: int = _SCAN_COLUMNS.index("logoid")
+# Successful scans only, so a transient miss is retried on the next call
+_SCAN_HITS: dict[tuple[str, str, str, tuple[str, ...]], "ResolvedSymbol"] = {}
+_SCAN_HITS_MAX: int = 1024
+
+_MIC_TO_TV: dict[str, str] = {
+    "XNYS": "america",
+    "XNAS": "america",
+    "XASE": "america",
+    "ARCX": "america",
+    "BATS": "america",
+    "IEXG": "america",
+    "XLON": "uk",
+    "XETR": "germany",
+    "XFRA": "germany",
+    "XPAR": "france",
+    "XAMS": "netherlands",
+    "XBRU": "belgium",
+    "XLIS": "portugal",
+    "XMIL": "italy",
+    "XMAD": "spain",
+    "XSWX": "switzerland",
+    "XSTO": "sweden",
+    "XCSE": "denmark",
+    "XOSL": "norway",
+    "XHEL": "finland",
+    "XWBO": "austria",
+    "XTKS": "japan",
+    "XHKG": "hongkong",
+    "XSHG": "china",
+    "XSHE": "china",
+    "XKRX": "korea",
+    "XTAI": "taiwan",
+    "XASX": "australia",
+    "XNZE": "newzealand",
+    "XSES": "singapore",
+    "XBOM": "india",
+    "XNSE": "india",
+    "XTSE": "canada",
+    "BVMF": "brazil",
+    "XMEX": "mexico",
+    "XJSE": "rsa",
+}
+
+_SYMBOL_PLACEHOLDER: str = "__SYM__"
+_SYMBOL_TOKEN: str = json.dumps(_SYMBOL_PLACEHOLDER)
+
+_CHART_TEMPLATE: str = json.dumps(
+    {
+        "symbol": _SYMBOL_PLACEHOLDER,
+        "theme": "light",
+        "style": "1",
+        "interval": "W",
+        "timezone": "Etc/UTC",
+        "locale": "en",
+        "allow_symbol_change": False,
+        "hide_side_toolbar": True,
+        "hide_top_toolbar": False,
+        "hide_legend": False,
+        "hide_volume": False,
+        "calendar": False,
+        "details": False,
+        "hotlist": False,
+        "save_image": False,
+        "withdateranges": False,
+        "range": "12M",
+        "backgroundColor": "#ffffff",
+        "gridColor": "rgba(46, 46, 46, 0.06)",
+        "watchlist": [],
+        "compareSymbols": [],
+        "studies": ["STD;SMA"],
+        "width": "100%",
+        "height": 660,
+    },
+    separators=(",", ":"),
+)
+
+_PROFILE_TEMPLATE: str = json.dumps(
+    {
+        "symbol": _SYMBOL_PLACEHOLDER,
+        "width": "100%",
+        "height": 360,
+        "isTransparent": True,
+        "colorTheme": "light",
+        "locale": "en",
+    },
+    separators=(",", ":"),
+)
+
+_CHART_JS: str = (
+    "https://s3.tradingview.com/external-embedding/embed-widget-advanced-chart.js"
+)
+_PROFILE_JS: str = (
+    "https://s3.tradingview.com/external-embedding/embed-widget-symbol-profile.js"
+)
+_WIDGET_CONTAINER_OPEN: str = (
+    '<div class="tradingview-widget-container">'
+    '<div class="tradingview-widget-container__widget"></div>'
+)
+_CHART_WIDGET_OPEN: str = (
+    f'{_WIDGET_CONTAINER_OPEN}<script type="text/javascript" src="{_CHART_JS}" async>'
+)
+_PROFILE_WIDGET_OPEN: str = (
+    f'{_WIDGET_CONTAINER_OPEN}<script type="text/javascript" src="{_PROFILE_JS}" async>'
+)
+_WIDGET_CLOSE: str = "</script></div>"
+
+
+class ResolvedSymbol(NamedTuple):
+    """
+    A resolved TradingView symbol with its logo identifier.
+    """
+
+    symbol: str
+    logoid: str | None
+
 
 @st.cache_data(ttl=3600, show_spinner="Resolving symbol...")
 def resolve_tv_symbol(
     symbol: str,
     equity_name: str,
     mics: str | None = None,
-) -> str:
+) -> ResolvedSymbol:
     """
     Resolve an equity into TradingView EXCHANGE:SYMBOL format.
 
     Queries the TradingView global scanner API with priority-ordered
-    searches: exact symbol match first, then fuzzy fallbacks.
+    searches: exact symbol match first, then fuzzy fallbacks. The searches
+    are issued concurrently and the highest-priority hit wins. The logoid
+    is requested in the same scan, avoiding a separate logo lookup.
 
     Args:
         symbol: The equity ticker symbol.
@@ -25,7 +154,7 @@ def resolve_tv_symbol(
         mics: Optional comma-separated MIC codes.
 
     Returns:
-        str: The resolved TradingView symbol string.
+        ResolvedSymbol: The resolved symbol and its logoid (None if absent).
     """
     markets = _mics_to_tv_markets(mics)
     searches = (
@@ -33,43 +162,14 @@ def resolve_tv_symbol(
         ("description", equity_name, "match"),
         ("name", symbol, "match"),
     )
-    for field, query, operation in searches:
-        if not query:
-            continue
-        result = _try_scan(field, query, operation, markets)
-        if result is not None:
-            return result
-    return symbol
-
-
-@st.cache_data(ttl=3600, show_spinner="Fetching logo...")
-def fetch_logo(tv_sym: str) -> str | None:
-    """
-    Fetch the logoid for a symbol from TradingView.
-
-    Args:
-        tv_sym: The TradingView EXCHANGE:SYMBOL string.
-
-    Returns:
-        str | None: The logoid string, or None if unavailable.
-    """
-    body = {
-        "symbols": {"tickers": [tv_sym]},
-        "columns": ["logoid"],
-    }
-    try:
-        resp = httpx.post(
-            "https://scanner.tradingview.com/global/scan",
-            json=body,
-            timeout=10,
-        )
-        resp.raise_for_status()
-        rows = resp.json().get("data", [])
-        if rows:
-            return rows[0].get("d", [None])[0]
-    except Exception:
-        pass
-    return None
+    futures = [
+        _PROBE_POOL.submit(_try_scan, field, query, operation, markets)
+        for field, query, operation in searches
+        if query
+    ]
+    results = (future.result() for future in futures)
+    fallback = ResolvedSymbol(symbol, None)
+    return next((r for r in results if r is not None), fallback)
 
 
 def logo_url(logoid: str) -> str:
@@ -92,17 +192,8 @@ def render_chart(tv_symbol: str) -> None:
     Args:
         tv_symbol: The resolved TradingView symbol.
     """
-    config = _chart_config(tv_symbol)
-    chart_js = (
-        "https://s3.tradingview.com/external-embedding/embed-widget-advanced-chart.js"
-    )
-    html = (
-        '<div class="tradingview-widget-container">'
-        '<div class="tradingview-widget-container__widget"></div>'
-        f'<script type="text/javascript" src="{chart_js}" async>'
-        f"{config}</script></div>"
-    )
-    components.html(html, height=700)
+    html = _CHART_WIDGET_OPEN + _chart_config(tv_symbol) + _WIDGET_CLOSE
+    components.html(html, height=700, scrolling=False)
 
 
 def render_profile(tv_symbol: str) -> None:
@@ -112,60 +203,111 @@ def render_profile(tv_symbol: str) -> None:
     Args:
         tv_symbol: The resolved TradingView symbol.
     """
-    profile_js = (
-        "https://s3.tradingview.com/external-embedding/embed-widget-symbol-profile.js"
-    )
-    config = json.dumps(
-        {
-            "symbol": tv_symbol,
-            "width": "100%",
-            "height": 360,
-            "isTransparent": True,
-            "colorTheme": "light",
-            "locale": "en",
-        }
-    )
-    html = (
-        '<div class="tradingview-widget-container">'
-        '<div class="tradingview-widget-container__widget"></div>'
-        f'<script type="text/javascript" src="{profile_js}" async>'
-        f"{config}</script></div>"
-    )
-    components.html(html, height=360)
+    config = _PROFILE_TEMPLATE.replace(_SYMBOL_TOKEN, json.dumps(tv_symbol))
+    html = _PROFILE_WIDGET_OPEN + config + _WIDGET_CLOSE
+    components.html(html, height=360, scrolling=False)
 
 
 def _try_scan(
     field: str,
     query: str,
     operation: str,
-    markets: list[str],
-) -> str | None:
+    markets: tuple[str, ...],
+) -> ResolvedSymbol | None:
     """
     Attempt a single TradingView scanner search and return the top result.
 
+    Note:
+        Different equities frequently produce identical searches (same
+        ticker on the same exchanges), so hits are memoised on the full
+        request key, avoiding repeat network round-trips that the outer
+        Streamlit cache cannot see. Misses and errors are never memoised.
+
     Args:
         field: The field to filter on (e.g. "name", "description").
         query: The search query value.
         operation: The filter operation (e.g. "equal", "match").
-        markets: List of TradingView market identifiers.
+        markets: Tuple of TradingView market identifiers.
 
     Returns:
-        str | None: The matched symbol, or None on failure.
+        ResolvedSymbol | None: The matched symbol, or None on failure.
     """
-    body = _build_scan_request(field, query, operation, markets)
+    key = (field, query, operation, markets)
+    if (hit := _SCAN_HITS.get(key)) is not None:
+        return hit
     try:
-        resp = httpx.post(
-            "https://scanner.tradingview.com/global/scan",
-            json=body,
-            timeout=10,
-        )
-        resp.raise_for_status()
-        rows = resp.json().get("data", [])
-        if rows:
-            return rows[0].get("s")
+        result = _scan(field, query, operation, markets)
     except Exception:
-        pass
-    return None
+        return None
+    if result is not None and len(_SCAN_HITS) < _SCAN_HITS_MAX:
+        _SCAN_HITS[key] = result
+    return result
+
+
+def _scan(
+    field: str,
+    query: str,
+    operation: str,
+    markets_key: tuple[str, ...],
+) -> ResolvedSymbol | None:
+    """
+    Run a single TradingView scanner search.
+
+    Args:
+        field: The field to filter on (e.g. "name", "description").
+        query: The search query value.
+        operation: The filter operation (e.g. "equal", "match").
+        markets_key: Tuple of TradingView market identifiers.
+
+    Returns:
+        ResolvedSymbol | None: The matched symbol, or None if nothing matched
+            or the top result carries no symbol.
+    """
+    body = _build_scan_request(field, query, operation, list(markets_key))
+    resp = _scanner().post("/global/scan", json=body)
+    resp.raise_for_status()
+    rows = resp.json().get("data", [])
+    if not rows or not (symbol := rows[0].get("s")):
+        return None
+    values = rows[0].get("d") or [None] * len(_SCAN_COLUMNS)
+    return ResolvedSymbol(symbol, values[_LOGOID_INDEX])
+
+
+def _scanner() -> "httpx.Client":
+    """
+    Return the shared TradingView scanner client, creating it on first use.
+
+    Creation is serialised so concurrent probes cannot build duplicate
+    clients.
+
+    Returns:
+        httpx.Client: Keep-alive HTTP/2 client bound to the scanner host.
+    """
+    with _SCANNER_LOCK:
+        return _create_scanner()
+
+
+@functools.cache
+def _create_scanner() -> "httpx.Client":
+    """
+    Create the TradingView scanner client and register it for cleanup.
+
+    httpx is imported here rather than at module load so that page runs
+    which never resolve a symbol do not pay its import cost.
+
+    Returns:
+        httpx.Client: Keep-alive HTTP/2 client bound to the scanner host.
+    """
+    import httpx  # noqa: PLC0415
+
+    client = httpx.Client(
+        base_url="https://scanner.tradingview.com",
+        http2=True,
+        timeout=10,
+        limits=httpx.Limits(max_keepalive_connections=4),
+    )
+    atexit.register(client.close)
+    return client
 
 
 def _build_scan_request(
@@ -184,7 +326,7 @@ def _build_scan_request(
         markets: List of TradingView market identifiers.
 
     Returns:
-        dict: Request body dict ready for httpx.post().
+        dict: Request body dict ready for the scanner client.
     """
     return {
         "markets": markets,
@@ -196,76 +338,37 @@ def _build_scan_request(
         "filter": [
             {"left": field, "operation": operation, "right": query},
         ],
-        "columns": ["name", "description", "volume"],
+        "columns": list(_SCAN_COLUMNS),
         "sort": {"sortBy": "volume", "sortOrder": "desc"},
         "range": [0, 1],
     }
 
 
-def _mics_to_tv_markets(mics: str | None) -> list[str]:
+@functools.lru_cache(maxsize=512)
+def _mics_to_tv_markets(mics: str | None) -> tuple[str, ...]:
     """
-    Map comma-separated MICs to a deduplicated list of TV market identifiers.
+    Map comma-separated MICs to a deduplicated tuple of TV market identifiers.
 
-    Uses dict.fromkeys() for O(n) deduplication with preserved order.
+    Deduplicates in a single ordered pass using a seen-set. Results are
+    memoised on the raw MIC string, which repeats across equities listed on
+    the same exchanges.
 
     Args:
         mics: Comma-separated MIC codes (e.g. "XNYS,XNAS").
 
     Returns:
-        list[str]: Deduplicated list of TradingView market identifiers.
+        tuple[str, ...]: Deduplicated TradingView market identifiers.
     """
     if not mics:
-        return []
-    mic_map = _mic_to_tv_market_map()
-    markets = (mic_map.get(mic.strip()) for mic in mics.split(","))
-    return list(dict.fromkeys(m for m in markets if m))
-
-
-def _mic_to_tv_market_map() -> dict[str, str]:
-    """
-    Return the MIC-to-TradingView market mapping table.
-
-    Returns:
-        dict[str, str]: Mapping from MIC codes to TradingView market names.
-    """
-    return {
-        "XNYS": "america",
-        "XNAS": "america",
-        "XASE": "america",
-        "ARCX": "america",
-        "BATS": "america",
-        "IEXG": "america",
-        "XLON": "uk",
-        "XETR": "germany",
-        "XFRA": "germany",
-        "XPAR": "france",
-        "XAMS": "netherlands",
-        "XBRU": "belgium",
-        "XLIS": "portugal",
-        "XMIL": "italy",
-        "XMAD": "spain",
-        "XSWX": "switzerland",
-        "XSTO": "sweden",
-        "XCSE": "denmark",
-        "XOSL": "norway",
-        "XHEL": "finland",
-        "XWBO": "austria",
-        "XTKS": "japan",
-        "XHKG": "hongkong",
-        "XSHG": "china",
-        "XSHE": "china",
-        "XKRX": "korea",
-        "XTAI": "taiwan",
-        "XASX": "australia",
-        "XNZE": "newzealand",
-        "XSES": "singapore",
-        "XBOM": "india",
-        "XNSE": "india",
-        "XTSE": "canada",
-        "BVMF": "brazil",
-        "XMEX": "mexico",
-        "XJSE": "rsa",
-    }
+        return ()
+    seen: set[str] = set()
+    markets: list[str] = []
+    for mic in mics.split(","):
+        market = _MIC_TO_TV.get(mic.strip())
+        if market and market not in seen:
+            seen.add(market)
+            markets.append(market)
+    return tuple(markets)
 
 
 def _chart_config(tv_symbol: str) -> str:
@@ -278,31 +381,4 @@ def _chart_config(tv_symbol: str) -> str:
     Returns:
         str: JSON-encoded config string.
     """
-    return json.dumps(
-        {
-            "symbol": tv_symbol,
-            "theme": "light",
-            "style": "1",
-            "interval": "W",
-            "timezone": "Etc/UTC",
-            "locale": "en",
-            "allow_symbol_change": False,
-            "hide_side_toolbar": True,
-            "hide_top_toolbar": False,
-            "hide_legend": False,
-            "hide_volume": False,
-            "calendar": False,
-            "details": False,
-            "hotlist": False,
-            "save_image": False,
-            "withdateranges": False,
-            "range": "12M",
-            "backgroundColor": "#ffffff",
-            "gridColor": "rgba(46, 46, 46, 0.06)",
-            "watchlist": [],
-            "compareSymbols": [],
-            "studies": ["STD;SMA"],
-            "width": "100%",
-            "height": 660,
-        }
-    )
+    return _CHART_TEMPLATE.replace(_SYMBOL_TOKEN, json.dumps(tv_symbol))
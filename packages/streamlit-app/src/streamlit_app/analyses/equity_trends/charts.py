@@ -1,301 +1,253 @@
 # charts.py
 
+from typing import Any, NamedTuple
+
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-
-
-def build_price_chart(df: pd.DataFrame) -> go.Figure | None:
-    """
-    Build a line chart of historical equity prices.
+import streamlit as st
+
+_LTTB_THRESHOLD: int = 2000
+
+
+class TraceSpec(NamedTuple):
+    """
+    A single chart trace: source column, legend label, and rendering style.
+    """
+
+    column: str
+    label: str
+    kind: str = "line"
+    secondary: bool = False
+    opacity: float | None = None
+
+
+class ChartSpec(NamedTuple):
+    """
+    A trend chart definition: title, candidate traces, and layout overrides.
+
+    Traces whose column has no data are skipped; a chart with no remaining
+    traces is not rendered. When max_points is set, the series is
+    downsampled on its first trace column before plotting.
+    """
+
+    title: str
+    traces: tuple[TraceSpec, ...]
+    layout: dict[str, Any]
+    max_points: int | None = None
+
+
+_BASE_LAYOUT: dict[str, Any] = {
+    "margin": {"l": 40, "r": 20, "t": 30, "b": 40},
+    "legend": {
+        "orientation": "h",
+        "yanchor": "bottom",
+        "y": 1.02,
+        "xanchor": "right",
+        "x": 1,
+    },
+    "hovermode": "x unified",
+    "template": "plotly_white",
+    "xaxis": {"type": "date"},
+}
+
+_SECONDARY_AXIS: dict[str, str] = {"overlaying": "y", "side": "right"}
+
+PRICE_CHART: ChartSpec = ChartSpec(
+    "Price",
+    (TraceSpec("last_price", "Price"),),
+    {"yaxis_title": "Price"},
+    max_points=_LTTB_THRESHOLD,
+)
+
+CHART_ROWS: tuple[tuple[ChartSpec, ...], ...] = (
+    (
+        ChartSpec(
+            "Margins",
+            (
+                TraceSpec("gross_margin", "Gross Margin"),
+                TraceSpec("operating_margin", "Operating Margin"),
+                TraceSpec("profit_margin", "Profit Margin"),
+            ),
+            {"yaxis_title": "Margin", "yaxis_tickformat": ".1%"},
+        ),
+        ChartSpec(
+            "Earnings & Revenue",
+            (
+                TraceSpec(
+                    "revenue_per_share",
+                    "Revenue/Share",
+                    kind="bar",
+                    secondary=True,
+                    opacity=0.5,
+                ),
+                TraceSpec("trailing_eps", "Trailing EPS"),
+            ),
+            {
+                "yaxis_title": "EPS",
+                "yaxis2": {"title": "Revenue/Share", **_SECONDARY_AXIS},
+            },
+        ),
+    ),
+    (
+        ChartSpec(
+            "Valuation",
+            (
+                TraceSpec("price_to_book", "P/B"),
+                TraceSpec("trailing_pe", "P/E"),
+            ),
+            {"yaxis_title": "Ratio"},
+        ),
+        ChartSpec(
+            "Cash Flow",
+            (
+                TraceSpec("operating_cash_flow", "Operating Cash Flow", kind="bar"),
+                TraceSpec("free_cash_flow", "Free Cash Flow", kind="bar"),
+            ),
+            {"yaxis_title": "Cash Flow", "barmode": "group"},
+        ),
+    ),
+    (
+        ChartSpec(
+            "Debt & Shares",
+            (
+                TraceSpec("total_debt", "Total Debt", kind="bar"),
+                TraceSpec("shares_outstanding", "Shares Outstanding", secondary=True),
+            ),
+            {
+                "yaxis_title": "Total Debt",
+                "yaxis2": {"title": "Shares Outstanding", **_SECONDARY_AXIS},
+            },
+        ),
+        ChartSpec(
+            "Ownership",
+            (
+                TraceSpec("held_insiders", "Insiders"),
+                TraceSpec("held_institutions", "Institutions"),
+            ),
+            {"yaxis_title": "Ownership %", "yaxis_tickformat": ".1%"},
+        ),
+    ),
+)
+
+
+@st.cache_data(ttl=900, show_spinner=False)
+def build_chart(
+    figi: str,
+    spec: ChartSpec,
+    available: frozenset[str],
+    _df: pd.DataFrame,
+) -> go.Figure | None:
+    """
+    Build a trend chart from its spec in a single Figure construction.
 
     Args:
-        df: DataFrame containing snapshot_date and last_price columns.
+        figi: Share class FIGI, used with spec as the cache key.
+        spec: The chart definition to render.
+        available: Columns of _df holding at least one non-null value.
+        _df: DataFrame containing snapshot_date and the spec's trace columns.
 
     Returns:
-        go.Figure | None: Price chart, or None if data is unavailable.
+        go.Figure | None: The chart, or None if none of its series has data.
     """
-    if not _has_data(df, "last_price"):
+    traces = [t for t in spec.traces if t.column in available]
+    if not traces:
         return None
 
-    fig = go.Figure()
-    fig.add_trace(
-        go.Scatter(
-            x=df["snapshot_date"],
-            y=df["last_price"],
-            mode="lines+markers",
-            name="Price",
-        )
+    frame = _df
+    if spec.max_points is not None:
+        frame = _downsample(_df, traces[0].column, spec.max_points)
+    x = frame["snapshot_date"].to_numpy()
+    return go.Figure(
+        data=[_build_trace(frame, trace, x) for trace in traces],
+        layout={**_BASE_LAYOUT, **spec.layout},
     )
-    fig.update_layout(**_base_layout(), yaxis_title="Price")
-    return fig
 
 
-def build_margin_chart(df: pd.DataFrame) -> go.Figure | None:
+def _build_trace(
+    df: pd.DataFrame,
+    trace: TraceSpec,
+    x: np.ndarray,
+) -> go.Bar | go.Scattergl:
     """
-    Build a multi-line chart of gross, operating, and profit margins.
+    Build a single Plotly trace for a spec'd column.
 
     Args:
-        df: DataFrame containing snapshot_date and margin columns.
+        df: DataFrame containing the trace column.
+        trace: The trace definition.
+        x: Snapshot dates shared by every trace in the figure.
 
     Returns:
-        go.Figure | None: Margin chart, or None if no margin data exists.
+        go.Bar | go.Scattergl: A bar trace, or a WebGL line-and-marker trace.
     """
-    cols = {
-        "gross_margin": "Gross Margin",
-        "operating_margin": "Operating Margin",
-        "profit_margin": "Profit Margin",
+    common: dict[str, Any] = {
+        "x": x,
+        "y": df[trace.column],
+        "name": trace.label,
     }
-    available = {c: label for c, label in cols.items() if _has_data(df, c)}
-    if not available:
-        return None
-
-    fig = go.Figure()
-    for col, label in available.items():
-        fig.add_trace(
-            go.Scatter(
-                x=df["snapshot_date"],
-                y=df[col],
-                mode="lines+markers",
-                name=label,
-            )
-        )
-    fig.update_layout(
-        **_base_layout(),
-        yaxis_title="Margin",
-        yaxis_tickformat=".1%",
-    )
-    return fig
+    if trace.secondary:
+        common["yaxis"] = "y2"
+    if trace.kind == "bar":
+        return go.Bar(**common, opacity=trace.opacity)
+    return go.Scattergl(**common, mode="lines+markers")
 
 
-def build_earnings_chart(df: pd.DataFrame) -> go.Figure | None:
+def _downsample(df: pd.DataFrame, col: str, n_out: int) -> pd.DataFrame:
     """
-    Build a dual-axis chart of trailing EPS (line) and revenue per share (bar).
+    Reduce a snapshot series to at most n_out points via LTTB.
 
-    Args:
-        df: DataFrame containing snapshot_date and earnings columns.
-
-    Returns:
-        go.Figure | None: Earnings chart, or None if neither series exists.
-    """
-    has_eps = _has_data(df, "trailing_eps")
-    has_rev = _has_data(df, "revenue_per_share")
-    if not has_eps and not has_rev:
-        return None
-
-    fig = go.Figure()
-    if has_rev:
-        fig.add_trace(
-            go.Bar(
-                x=df["snapshot_date"],
-                y=df["revenue_per_share"],
-                name="Revenue/Share",
-                yaxis="y2",
-                opacity=0.5,
-            )
-        )
-    if has_eps:
-        fig.add_trace(
-            go.Scatter(
-                x=df["snapshot_date"],
-                y=df["trailing_eps"],
-                mode="lines+markers",
-                name="Trailing EPS",
-            )
-        )
-    fig.update_layout(
-        **_base_layout(),
-        yaxis_title="EPS",
-        yaxis2={
-            "title": "Revenue/Share",
-            "overlaying": "y",
-            "side": "right",
-        },
-    )
-    return fig
-
-
-def build_valuation_chart(df: pd.DataFrame) -> go.Figure | None:
-    """
-    Build a multi-line chart of valuation ratios (P/B and P/E).
+    Rows without a value in col are dropped before downsampling. Points
+    are placed on the snapshot_date time axis, as nanoseconds since the
+    first snapshot, so uneven gaps between snapshots weigh into the
+    selection. Frames at or under the limit are returned unchanged.
 
     Args:
-        df: DataFrame containing snapshot_date and valuation columns.
+        df: DataFrame containing snapshot_date and the value column.
+        col: Name of the value column to downsample on.
+        n_out: Maximum number of points to keep.
 
     Returns:
-        go.Figure | None: Valuation chart, or None if no ratio data exists.
-    """
-    cols = {
-        "price_to_book": "P/B",
-        "trailing_pe": "P/E",
-    }
-    available = {c: label for c, label in cols.items() if _has_data(df, c)}
-    if not available:
-        return None
-
-    fig = go.Figure()
-    for col, label in available.items():
-        fig.add_trace(
-            go.Scatter(
-                x=df["snapshot_date"],
-                y=df[col],
-                mode="lines+markers",
-                name=label,
-            )
-        )
-    fig.update_layout(**_base_layout(), yaxis_title="Ratio")
-    return fig
-
-
-def build_cash_flow_chart(df: pd.DataFrame) -> go.Figure | None:
-    """
-    Build a grouped bar chart of operating and free cash flow.
-
-    Args:
-        df: DataFrame containing snapshot_date and cash flow columns.
-
-    Returns:
-        go.Figure | None: Cash flow chart, or None if no data exists.
-    """
-    cols = {
-        "operating_cash_flow": "Operating Cash Flow",
-        "free_cash_flow": "Free Cash Flow",
-    }
-    available = {c: label for c, label in cols.items() if _has_data(df, c)}
-    if not available:
-        return None
-
-    fig = go.Figure()
-    for col, label in available.items():
-        fig.add_trace(
-            go.Bar(
-                x=df["snapshot_date"],
-                y=df[col],
-                name=label,
-            )
-        )
-    fig.update_layout(
-        **_base_layout(),
-        yaxis_title="Cash Flow",
-        barmode="group",
-    )
-    return fig
-
-
-def build_debt_shares_chart(df: pd.DataFrame) -> go.Figure | None:
+        pd.DataFrame: The original frame, or the selected subset of rows.
     """
-    Build a dual-axis chart of total debt (bar) and shares outstanding (line).
+    if len(df) <= n_out:
+        return df
+    series = df[["snapshot_date", col]].dropna(subset=[col])
+    y = series[col].to_numpy(dtype=np.float64)
+    ns = series["snapshot_date"].to_numpy(dtype="datetime64[ns]").astype(np.int64)
+    x = (ns - ns[:1]).astype(np.float64)
+    return series.iloc[_lttb_indices(x, y, n_out)]
 
-    Args:
-        df: DataFrame containing snapshot_date, total_debt, and
-            shares_outstanding columns.
 
-    Returns:
-        go.Figure | None: Debt/shares chart, or None if neither series exists.
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
     """
-    has_debt = _has_data(df, "total_debt")
-    has_shares = _has_data(df, "shares_outstanding")
-    if not has_debt and not has_shares:
-        return None
+    Select point indices with Largest-Triangle-Three-Buckets downsampling.
 
-    fig = go.Figure()
-    if has_debt:
-        fig.add_trace(
-            go.Bar(
-                x=df["snapshot_date"],
-                y=df["total_debt"],
-                name="Total Debt",
-            )
-        )
-    if has_shares:
-        fig.add_trace(
-            go.Scatter(
-                x=df["snapshot_date"],
-                y=df["shares_outstanding"],
-                mode="lines+markers",
-                name="Shares Outstanding",
-                yaxis="y2",
-            )
-        )
-    fig.update_layout(
-        **_base_layout(),
-        yaxis_title="Total Debt",
-        yaxis2={
-            "title": "Shares Outstanding",
-            "overlaying": "y",
-            "side": "right",
-        },
-    )
-    return fig
-
-
-def build_ownership_chart(df: pd.DataFrame) -> go.Figure | None:
-    """
-    Build a multi-line chart of insider and institutional ownership.
+    The first and last points are always kept; each interior bucket keeps
+    the point forming the largest triangle with the previously selected
+    point and the mean of the following bucket.
 
     Args:
-        df: DataFrame containing snapshot_date and ownership columns.
+        x: Monotonic x coordinates.
+        y: Values aligned with x, without NaNs.
+        n_out: Number of points to select (at least 3).
 
     Returns:
-        go.Figure | None: Ownership chart, or None if no data exists.
-    """
-    cols = {
-        "held_insiders": "Insiders",
-        "held_institutions": "Institutions",
-    }
-    available = {c: label for c, label in cols.items() if _has_data(df, c)}
-    if not available:
-        return None
-
-    fig = go.Figure()
-    for col, label in available.items():
-        fig.add_trace(
-            go.Scatter(
-                x=df["snapshot_date"],
-                y=df[col],
-                mode="lines+markers",
-                name=label,
-            )
+        np.ndarray: Sorted integer indices of the selected points.
+    """
+    n = len(x)
+    if n <= n_out:
+        return np.arange(n)
+    edges = np.append(np.linspace(1, n - 1, n_out - 1).astype(np.int64), n)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    prev = 0
+    for bucket in range(n_out - 2):
+        start, end, nxt_end = edges[bucket : bucket + 3]
+        avg_x, avg_y = x[end:nxt_end].mean(), y[end:nxt_end].mean()
+        area = np.abs(
+            (x[prev] - avg_x) * (y[start:end] - y[prev])
+            - (x[prev] - x[start:end]) * (avg_y - y[prev])
         )
-    fig.update_layout(
-        **_base_layout(),
-        yaxis_title="Ownership %",
-        yaxis_tickformat=".1%",
-    )
-    return fig
-
-
-def _base_layout() -> dict:
-    """
-    Return the base Plotly layout configuration shared by all charts.
-
-    Returns:
-        dict: Layout kwargs for fig.update_layout().
-    """
-    return {
-        "margin": {"l": 40, "r": 20, "t": 30, "b": 40},
-        "legend": {
-            "orientation": "h",
-            "yanchor": "bottom",
-            "y": 1.02,
-            "xanchor": "right",
-            "x": 1,
-        },
-        "hovermode": "x unified",
-        "template": "plotly_white",
-        "xaxis": {"type": "category"},
-    }
-
-
-def _has_data(df: pd.DataFrame, col: str) -> bool:
-    """
-    Check whether a DataFrame column exists and contains at least one
-    non-null value.
-
-    Args:
-        df: The DataFrame to inspect.
-        col: Column name to check.
-
-    Returns:
-        bool: True if the column has data, False otherwise.
-    """
-    return col in df.columns and df[col].notna().any()
+        prev = start + int(np.argmax(area))
+        selected[bucket + 1] = prev
+    return selected
@@ -1,17 +1,48 @@
 # data_provider.py
 
-from decimal import Decimal
+from collections.abc import Callable
+from operator import attrgetter
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 from equity_aggregator import retrieve_canonical_equity_history
 
+_FIELD_PATHS: tuple[tuple[str, str], ...] = (
+    ("snapshot_date", "snapshot_date"),
+    ("last_price", "financials.last_price"),
+    ("trailing_pe", "financials.trailing_pe"),
+    ("price_to_book", "financials.price_to_book"),
+    ("trailing_eps", "financials.trailing_eps"),
+    ("revenue_per_share", "financials.revenue_per_share"),
+    ("profit_margin", "financials.profit_margin"),
+    ("gross_margin", "financials.gross_margin"),
+    ("operating_margin", "financials.operating_margin"),
+    ("operating_cash_flow", "financials.operating_cash_flow"),
+    ("free_cash_flow", "financials.free_cash_flow"),
+    ("total_debt", "financials.total_debt"),
+    ("shares_outstanding", "financials.shares_outstanding"),
+    ("held_insiders", "financials.held_insiders"),
+    ("held_institutions", "financials.held_institutions"),
+    ("revenue", "financials.revenue"),
+    ("ebitda", "financials.ebitda"),
+)
+_COLUMNS: list[str] = [col for col, _ in _FIELD_PATHS]
+_GETTERS: tuple[Callable[[object], object], ...] = tuple(
+    attrgetter(path) for _, path in _FIELD_PATHS
+)
+_NUMERIC_COLUMNS: list[str] = [col for col in _COLUMNS if col != "snapshot_date"]
+
 
 @st.cache_data(ttl=900)
 def load_history(figi: str) -> pd.DataFrame:
     """
     Fetch canonical equity history snapshots and return them as a DataFrame.
 
+    Financial fields are materialised directly as float64 arrays, so the
+    frame is assembled without a separate dtype conversion pass. Snapshot
+    dates are kept as native datetime64 values rather than date objects.
+
     Args:
         figi: Share class FIGI identifier for the equity.
 
@@ -24,71 +55,46 @@ def load_history(figi: str) -> pd.DataFrame:
     except LookupError:
         return pd.DataFrame()
 
-    rows = [_snapshot_to_row(s) for s in snapshots]
-    df = pd.DataFrame(rows)
-    if "snapshot_date" in df.columns:
-        df["snapshot_date"] = pd.to_datetime(df["snapshot_date"]).dt.date
+    df = pd.DataFrame(_snapshots_to_columns(snapshots), columns=_COLUMNS, copy=False)
+    df["snapshot_date"] = pd.to_datetime(df["snapshot_date"])
     return df
 
 
-def _snapshot_to_row(snapshot: object) -> dict[str, object]:
+def _snapshots_to_columns(
+    snapshots: list[object],
+) -> dict[str, list[object] | np.ndarray]:
     """
-    Map a single equity snapshot to a flat dict keyed by column names.
-
-    Args:
-        snapshot: A CanonicalEquity instance from equity-aggregator.
+    Map equity snapshots to column arrays keyed by column names.
 
-    Returns:
-        dict[str, object]: Flat dict suitable for a single DataFrame row.
-    """
-    fields = (
-        ("snapshot_date", "snapshot_date"),
-        ("last_price", "financials.last_price"),
-        ("trailing_pe", "financials.trailing_pe"),
-        ("price_to_book", "financials.price_to_book"),
-        ("trailing_eps", "financials.trailing_eps"),
-        ("revenue_per_share", "financials.revenue_per_share"),
-        ("profit_margin", "financials.profit_margin"),
-        ("gross_margin", "financials.gross_margin"),
-        ("operating_margin", "financials.operating_margin"),
-        ("operating_cash_flow", "financials.operating_cash_flow"),
-        ("free_cash_flow", "financials.free_cash_flow"),
-        ("total_debt", "financials.total_debt"),
-        ("shares_outstanding", "financials.shares_outstanding"),
-        ("held_insiders", "financials.held_insiders"),
-        ("held_institutions", "financials.held_institutions"),
-        ("revenue", "financials.revenue"),
-        ("ebitda", "financials.ebitda"),
-    )
-    return {col: _coerce_decimal(_resolve(snapshot, path)) for col, path in fields}
-
-
-def _coerce_decimal(value: object) -> object:
-    """
-    Coerce a Decimal to float for pandas numeric dtype efficiency.
+    Values are gathered column by column so pandas can build each column
+    directly without transposing row dicts. Numeric columns are converted
+    to float64 arrays, with missing values becoming NaN.
 
     Args:
-        value: The value to potentially coerce.
+        snapshots: CanonicalEquity instances from equity-aggregator.
 
     Returns:
-        object: A float if the input was Decimal, otherwise the original value.
+        dict[str, list[object] | np.ndarray]: One sequence of values per column.
     """
-    return float(value) if isinstance(value, Decimal) else value
+    values = ([_safe_get(getter, s) for s in snapshots] for getter in _GETTERS)
+    columns = dict(zip(_COLUMNS, values, strict=True))
+    for col in _NUMERIC_COLUMNS:
+        columns[col] = np.array(columns[col], dtype=np.float64)
+    return columns
 
 
-def _resolve(obj: object, dot_path: str) -> object:
+def _safe_get(getter: Callable[[object], object], obj: object) -> object:
     """
-    Resolve a dot-separated attribute path on an object via getattr chain.
+    Apply a precompiled attribute getter, treating missing segments as None.
 
     Args:
+        getter: An operator.attrgetter for a dot-delimited path.
         obj: Root object to traverse.
-        dot_path: Dot-delimited attribute path (e.g. "financials.last_price").
 
     Returns:
         object: The resolved attribute value, or None if any segment is missing.
     """
-    for attr in dot_path.split("."):
-        obj = getattr(obj, attr, None)
-        if obj is None:
-            return None
-    return obj
+    try:
+        return getter(obj)
+    except AttributeError:
+        return None
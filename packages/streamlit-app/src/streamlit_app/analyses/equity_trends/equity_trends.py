@@ -1,7 +1,5 @@
 # equity_trends.py
 
-from typing import Any
-
 import streamlit as st
 
 from streamlit_app.analyses.equity_trends.data_provider import load_history
@@ -11,18 +9,13 @@ from streamlit_app.analyses.equity_trends.renderers import (
 )
 
 # Session state guard
-data: dict[str, Any] | None = st.session_state.get("selected_equity_data")
+figi: str | None = st.session_state.get("selected_equity_figi")
 name: str | None = st.session_state.get("selected_equity_name")
 
-if not data or not name:
+if not figi or not name:
     st.info("Select an equity from the Universe table to view equity trends.")
     st.stop()
 
-figi = data.get("Share Class FIGI", "")
-if not figi:
-    st.warning("No FIGI available for this equity.")
-    st.stop()
-
 df = load_history(figi)
 
 render_header(name, df)
@@ -31,4 +24,4 @@ if df.empty:
     st.info("No snapshot data available.")
     st.stop()
 
-render_trends(df)
+render_trends(figi, df)
@@ -1,19 +1,13 @@
 # renderers.py
 
-from collections.abc import Callable
-
 import pandas as pd
-import plotly.graph_objects as go
 import streamlit as st
 
 from streamlit_app.analyses.equity_trends.charts import (
-    build_cash_flow_chart,
-    build_debt_shares_chart,
-    build_earnings_chart,
-    build_margin_chart,
-    build_ownership_chart,
-    build_price_chart,
-    build_valuation_chart,
+    CHART_ROWS,
+    PRICE_CHART,
+    ChartSpec,
+    build_chart,
 )
 
 
@@ -31,31 +25,45 @@ def render_header(name: str, df: pd.DataFrame) -> None:
     dates = df["snapshot_date"].dropna()
     if dates.empty:
         return
-    st.caption(f"{len(dates)} snapshot(s) \u2014 {dates.min()} to {dates.max()}")
+    st.caption(
+        f"{len(dates)} snapshot(s) \u2014 "
+        f"{dates.min():%Y-%m-%d} to {dates.max():%Y-%m-%d}"
+    )
 
 
-def render_trends(df: pd.DataFrame) -> None:
+def render_trends(figi: str, df: pd.DataFrame) -> None:
     """
     Render all trend charts: a full-width price chart followed by paired rows.
 
+    Column availability is computed once in a single vectorised sweep and
+    shared by every chart, rather than rescanning each column per chart.
+
     Args:
+        figi: Share class FIGI, used to key the cached chart figures.
         df: Historical snapshot DataFrame.
     """
-    _render_price_chart(df)
-    _render_paired_charts(df)
+    available = frozenset(df.columns[df.notna().any()].tolist())
+    _render_price_chart(figi, df, available)
+    _render_paired_charts(figi, df, available)
 
 
-def _render_price_chart(df: pd.DataFrame) -> None:
+def _render_price_chart(
+    figi: str,
+    df: pd.DataFrame,
+    available: frozenset[str],
+) -> None:
     """
     Render the full-width price chart if data is available.
 
     Args:
+        figi: Share class FIGI, used to key the cached chart figure.
         df: Historical snapshot DataFrame.
+        available: Columns of df holding at least one non-null value.
     """
-    price_fig = build_price_chart(df)
+    price_fig = build_chart(figi, PRICE_CHART, available, df)
     if price_fig is None:
         return
-    st.subheader("Price")
+    st.subheader(PRICE_CHART.title)
     st.plotly_chart(
         price_fig,
         use_container_width=True,
@@ -63,43 +71,39 @@ def _render_price_chart(df: pd.DataFrame) -> None:
     )
 
 
-def _render_paired_charts(df: pd.DataFrame) -> None:
+def _render_paired_charts(
+    figi: str,
+    df: pd.DataFrame,
+    available: frozenset[str],
+) -> None:
     """
     Render paired chart rows in a two-column layout.
 
     Args:
+        figi: Share class FIGI, used to key the cached chart figures.
         df: Historical snapshot DataFrame.
+        available: Columns of df holding at least one non-null value.
     """
-    chart_rows: tuple[tuple[tuple[str, Callable[..., go.Figure | None]], ...], ...] = (
-        (
-            ("Margins", build_margin_chart),
-            ("Earnings & Revenue", build_earnings_chart),
-        ),
-        (
-            ("Valuation", build_valuation_chart),
-            ("Cash Flow", build_cash_flow_chart),
-        ),
-        (
-            ("Debt & Shares", build_debt_shares_chart),
-            ("Ownership", build_ownership_chart),
-        ),
-    )
-    for row in chart_rows:
-        _render_chart_row(df, row)
+    for row in CHART_ROWS:
+        _render_chart_row(figi, df, available, row)
 
 
 def _render_chart_row(
+    figi: str,
     df: pd.DataFrame,
-    row: tuple[tuple[str, Callable[..., go.Figure | None]], ...],
+    available: frozenset[str],
+    row: tuple[ChartSpec, ...],
 ) -> None:
     """
     Render a single row of paired charts in two columns.
 
     Args:
+        figi: Share class FIGI, used to key the cached chart figures.
         df: Historical snapshot DataFrame.
-        row: Tuple of (title, chart_builder) pairs for this row.
+        available: Columns of df holding at least one non-null value.
+        row: Chart specs for this row.
     """
-    figures = [(title, builder(df)) for title, builder in row]
+    figures = [(spec.title, build_chart(figi, spec, available, df)) for spec in row]
     visible = [(t, f) for t, f in figures if f is not None]
     if not visible:
         return
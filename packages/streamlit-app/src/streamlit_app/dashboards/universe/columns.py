@@ -171,6 +171,13 @@ LARGE_NUMBER_COLS: frozenset[str] = frozenset(
     }
 )
 RATIO_COLS: frozenset[str] = frozenset({"Trailing P/E", "Price/Book"})
+NUMERIC_COLS: frozenset[str] = (
+    CURRENCY_COLS
+    | LARGE_CURRENCY_COLS
+    | PERCENTAGE_COLS
+    | LARGE_NUMBER_COLS
+    | RATIO_COLS
+)
 
 PCT_STYLE_COLS: frozenset[str] = frozenset(
     {
@@ -207,3 +214,9 @@ FORMATTER_TABLE: tuple[FormatterRule, ...] = (
     ),
     FormatterRule(RATIO_FMT, RATIO_COLS, {"filter": "agNumberColumnFilter"}),
 )
+
+COLUMN_FORMATTERS: dict[str, tuple[Any, dict[str, Any]]] = {
+    col: (rule.formatter, rule.extra_kwargs)
+    for rule in FORMATTER_TABLE
+    for col in rule.columns
+}
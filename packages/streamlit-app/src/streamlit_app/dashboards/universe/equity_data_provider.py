@@ -1,93 +1,240 @@
 # data_provider.py
 
-from decimal import Decimal
+import contextlib
+import hashlib
+import os
+import tempfile
+from collections.abc import Callable
+from operator import attrgetter
+from pathlib import Path
+from typing import Any
 
 import pandas as pd
 import streamlit as st
 from equity_aggregator import retrieve_canonical_equities
-
-from streamlit_app.dashboards.universe.columns import DISPLAY_COLUMNS, FIELD_MAPPING
-
-
-@st.cache_resource(ttl=3600, show_spinner=False)
+from pyarrow import ArrowException
+
+from streamlit_app.dashboards.universe.columns import (
+    DISPLAY_COLUMNS,
+    FIELD_MAPPING,
+    NUMERIC_COLS,
+)
+
+_GETTERS: tuple[Callable[[object], object], ...] = tuple(
+    attrgetter(field.accessor) for field in FIELD_MAPPING
+)
+_NUMERIC_COLUMNS: list[str] = [col for col in DISPLAY_COLUMNS if col in NUMERIC_COLS]
+_PARQUET_CACHE_DIR: Path = Path(tempfile.gettempdir()) / "equity_cache"
+# Bump whenever the stored frame changes shape beyond DISPLAY_COLUMNS or dtypes
+_PARQUET_CACHE_VERSION: int = 1
+_PARQUET_CACHE_SCHEMA: str = "|".join(
+    (
+        str(_PARQUET_CACHE_VERSION),
+        ",".join(DISPLAY_COLUMNS),
+        ",".join(_NUMERIC_COLUMNS),
+        "float32",
+    )
+)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
 def load_equities() -> tuple[pd.DataFrame, str | None]:
     """
     Fetch all canonical equities and return them as a cached DataFrame.
 
+    Numeric columns are converted from Decimal to float in one vectorised
+    pass per column after the frame is built, then downcast to float32,
+    which is ample precision for display and filtering. Built frames are
+    persisted to a parquet file keyed by snapshot date and universe size, so
+    a cold start against an unchanged snapshot skips the column-building pass.
+    Each caller receives its own copy of the cached frame, so in-place
+    changes made while rendering do not leak into other sessions.
+
     Returns:
         tuple[pd.DataFrame, str | None]: DataFrame with columns matching
             DISPLAY_COLUMNS and latest snapshot date as YYYY-MM-DD or None.
     """
     equities = retrieve_canonical_equities()
-    data = [_equity_to_row(eq) for eq in equities]
     snapshot_date = equities[0].snapshot_date if equities else None
-    return pd.DataFrame(data, columns=list(DISPLAY_COLUMNS)), snapshot_date
+    cache_path = _parquet_cache_path(snapshot_date, len(equities))
+    cached = _read_parquet_cache(cache_path)
+    if cached is not None:
+        return cached, snapshot_date
+    df = pd.DataFrame(_equities_to_columns(equities), columns=list(DISPLAY_COLUMNS))
+    numeric = df[_NUMERIC_COLUMNS].apply(pd.to_numeric, errors="coerce")
+    df[_NUMERIC_COLUMNS] = numeric.astype("float32")
+    _write_parquet_cache(df, cache_path)
+    return df, snapshot_date
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_equity_row(figi: str) -> dict[str, Any] | None:
+    """
+    Look up a single equity's display row by its share class FIGI.
+
+    Lets pages keep only the FIGI in session state rather than a copy of
+    the whole row. Missing values are returned as None.
 
+    Args:
+        figi: Share class FIGI identifier for the equity.
 
-def _equity_to_row(equity: object) -> dict[str, object]:
+    Returns:
+        dict[str, Any] | None: Values keyed by DISPLAY_COLUMNS, or None if
+            the FIGI is not in the universe.
     """
-    Map a single CanonicalEquity to a flat dict keyed by display column names.
+    df, _ = load_equities()
+    matches = df[df["Share Class FIGI"] == figi]
+    if matches.empty:
+        return None
+    row = matches.iloc[0].astype(object)
+    return row.where(row.notna(), None).to_dict()
+
 
-    Driven by FIELD_MAPPING as its single source of truth.
+@st.cache_data(ttl=3600, show_spinner=False)
+def format_snapshot_label(snapshot_date: str) -> str:
+    """
+    Build the integrity report link label for a snapshot date.
 
     Args:
-        equity: A CanonicalEquity instance from equity-aggregator.
+        snapshot_date: Snapshot date as YYYY-MM-DD.
 
     Returns:
-        dict[str, object]: Flat dict suitable for a single DataFrame row.
+        str: Link label showing the date as DD/MM/YYYY.
     """
-    return {
-        name: _format_field(name, _resolve_accessor(equity, path))
-        for name, path in FIELD_MAPPING
-    }
+    day, month, year = snapshot_date[8:10], snapshot_date[5:7], snapshot_date[:4]
+    return f"_Integrity Report &middot; Last updated: {day}/{month}/{year}_"
 
 
-def _format_field(name: str, value: object) -> object:
+def _parquet_cache_path(snapshot_date: str | None, count: int) -> Path:
     """
-    Coerce a resolved field value into its display-ready form.
+    Build the on-disk parquet cache path for a universe snapshot.
 
-    Joins MICs lists into comma-separated strings and coerces Decimals to float.
+    The key includes the frame schema, so files written by code with a
+    different column layout or dtypes are never picked up.
 
     Args:
-        name: The display column name.
-        value: The raw resolved value from the equity object.
+        snapshot_date: Snapshot date of the universe, or None if empty.
+        count: Number of equities in the universe.
 
     Returns:
-        object: The display-ready value.
+        Path: Location of the parquet file for this snapshot.
     """
-    if name == "MICs" and isinstance(value, list):
-        return ", ".join(value) if value else None
-    return _coerce_value(value)
+    raw_key = f"{_PARQUET_CACHE_SCHEMA}:{snapshot_date}:{count}".encode()
+    key = hashlib.blake2b(raw_key, digest_size=16).hexdigest()
+    return _PARQUET_CACHE_DIR / f"{key}.parquet"
 
 
-def _resolve_accessor(obj: object, dot_path: str) -> object:
+def _read_parquet_cache(path: Path) -> pd.DataFrame | None:
     """
-    Resolve a dot-separated attribute path on an object via getattr chain.
+    Load a previously persisted universe DataFrame.
 
     Args:
-        obj: Root object to traverse.
-        dot_path: Dot-delimited attribute path (e.g. `"identity.name"`).
+        path: Location of the parquet cache file.
 
     Returns:
-        object: The resolved attribute value, or None if any segment is missing.
+        pd.DataFrame | None: The cached frame, or None if absent, unreadable
+            or not laid out as DISPLAY_COLUMNS.
     """
-    for attr in dot_path.split("."):
-        obj = getattr(obj, attr, None)
-        if obj is None:
-            return None
-    return obj
+    try:
+        df = pd.read_parquet(path, engine="pyarrow")
+    except (OSError, ValueError):
+        return None
+    return df if tuple(df.columns) == DISPLAY_COLUMNS else None
 
 
-def _coerce_value(value: object) -> object:
+def _write_parquet_cache(df: pd.DataFrame, path: Path) -> None:
     """
-    Coerce a Decimal to float for pandas numeric dtype efficiency.
+    Persist the universe DataFrame to parquet, ignoring write failures.
+
+    The frame is written to a temporary file in the cache directory and
+    atomically renamed into place, so readers never see a partial file.
+    Filesystem and Arrow serialisation errors are swallowed, as the cache
+    is an optimisation only. After a successful write, files left by
+    earlier snapshots or schemas are pruned.
 
     Args:
-        value: The value to potentially coerce.
+        df: The built universe DataFrame.
+        path: Destination of the parquet cache file.
+    """
+    with contextlib.suppress(OSError, ArrowException):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        try:
+            df.to_parquet(tmp_path, engine="pyarrow", compression="zstd", index=False)
+            tmp_path.replace(path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        _prune_parquet_cache(path)
+
+
+def _prune_parquet_cache(keep: Path) -> None:
+    """
+    Delete every cached parquet file other than the current one.
+
+    Note:
+        Temporary files are left alone, as they may belong to a write in
+        progress in another session.
+
+    Args:
+        keep: The freshly written cache file to retain.
+    """
+    for stale in keep.parent.glob("*.parquet"):
+        if stale != keep:
+            with contextlib.suppress(OSError):
+                stale.unlink()
+
+
+def _equities_to_columns(equities: list[object]) -> dict[str, list[object]]:
+    """
+    Map CanonicalEquity objects to column lists keyed by display column names.
+
+    Driven by FIELD_MAPPING as its single source of truth, via attrgetter
+    accessors precompiled at import in DISPLAY_COLUMNS order. Values are
+    gathered column by column so pandas can build each column directly
+    without transposing row dicts.
+
+    Args:
+        equities: CanonicalEquity instances from equity-aggregator.
+
+    Returns:
+        dict[str, list[object]]: One list of values per display column.
+    """
+    values = ([_safe_get(getter, eq) for eq in equities] for getter in _GETTERS)
+    columns = dict(zip(DISPLAY_COLUMNS, values, strict=True))
+    columns["MICs"] = [_join_mics(mics) for mics in columns["MICs"]]
+    return columns
+
+
+def _join_mics(value: object) -> object:
+    """
+    Join a MICs list into its comma-separated display form.
+
+    Args:
+        value: The raw MICs value from the equity object.
 
     Returns:
-        object: A float if the input was Decimal, otherwise the original value.
+        object: Comma-separated MICs, None for an empty list, or the
+            original value if it is not a list.
     """
-    if isinstance(value, Decimal):
-        return float(value)
+    if isinstance(value, list):
+        return ", ".join(value) if value else None
     return value
+
+
+def _safe_get(getter: Callable[[object], object], obj: object) -> object:
+    """
+    Apply a precompiled attribute getter, treating missing segments as None.
+
+    Args:
+        getter: An operator.attrgetter for a dot-delimited path.
+        obj: Root object to traverse.
+
+    Returns:
+        object: The resolved attribute value, or None if any segment is missing.
+    """
+    try:
+        return getter(obj)
+    except AttributeError:
+        return None
@@ -1,23 +1,29 @@
 # grid.py
 
+import copy
 from typing import Any
 
 import pandas as pd
 import streamlit as st
-from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode
+from st_aggrid import AgGrid, AgGridReturn, GridOptionsBuilder, GridUpdateMode
 
 from streamlit_app.dashboards.universe.columns import COLUMN_GROUPS
 from streamlit_app.dashboards.universe.grid_configurators import configure_columns
 
+_GROUPED_FIELDS: frozenset[str] = frozenset(
+    field for group in COLUMN_GROUPS for field in group.columns
+)
+
 
 def get_cached_grid_options(df: pd.DataFrame) -> dict[str, Any]:
     """
-    Return grid options, building and caching them in session state on
-    first call.
+    Return grid options for the DataFrame's schema, built once per process.
 
     Note:
-        The options are built once per session since the column structure
-        is static.
+        The options are built once and shared across sessions, keyed by
+        column names and dtypes since the column structure is static. AgGrid
+        mutates nested option dicts in place, so each caller receives its
+        own deep copy.
 
     Args:
         df: Source DataFrame whose columns seed the GridOptionsBuilder.
@@ -25,34 +31,45 @@ def get_cached_grid_options(df: pd.DataFrame) -> dict[str, Any]:
     Returns:
         dict[str, Any]: Complete grid options dict ready for AgGrid rendering.
     """
-    if "grid_options" not in st.session_state:
-        st.session_state["grid_options"] = _build_grid_options(df)
-    return st.session_state["grid_options"]
+    schema = tuple(zip(df.columns, df.dtypes.astype(str), strict=True))
+    return copy.deepcopy(_cached_grid_options(schema, df.iloc[:0]))
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_grid_options(
+    schema: tuple[tuple[str, str], ...],
+    _df: pd.DataFrame,
+) -> dict[str, Any]:
+    """
+    Build grid options once per DataFrame schema.
+
+    Args:
+        schema: Pairs of (column, dtype) used as the cache key.
+        _df: Empty DataFrame carrying the schema's columns and dtypes.
+
+    Returns:
+        dict[str, Any]: Complete grid options dict ready for AgGrid rendering.
+    """
+    return _build_grid_options(_df)
 
 
 @st.fragment
-def display_grid(
-    df: pd.DataFrame,
-    grid_options: dict[str, Any],
-    search_query: str = "",
-) -> None:
+def display_grid(df: pd.DataFrame, grid_options: dict[str, Any]) -> None:
     """
-    Render the AgGrid inside a fragment so selection changes only rerun this
-    fragment, not the full page.
+    Render the search bar and AgGrid inside a fragment so searching and
+    selection changes only rerun this fragment, not the full page.
 
-    On row selection, stores the equity in session state and navigates to the
-    equity analysis page.
+    On row selection, stores the equity's name and FIGI in session state and
+    navigates to the equity analysis page.
 
     Args:
         df: Source DataFrame to display.
         grid_options: Pre-built grid options from get_cached_grid_options.
-        search_query: Text to apply as the AgGrid quick filter.
     """
-    grid_options["quickFilterText"] = search_query
-
+    search_query = _render_search_bar()
     response = AgGrid(
         df,
-        gridOptions=grid_options,
+        gridOptions={**grid_options, "quickFilterText": search_query},
         update_mode=GridUpdateMode.SELECTION_CHANGED,
         key="universe_grid",
         fit_columns_on_grid_load=False,
@@ -61,13 +78,51 @@ def display_grid(
         allow_unsafe_jscode=True,
     )
 
-    if response.selected_rows is not None and len(response.selected_rows) > 0:
-        row = response.selected_rows.iloc[0]
+    position = _selected_position(response)
+    if position is not None:
+        row = df.iloc[position]
         st.session_state["selected_equity_name"] = row["Name"]
-        st.session_state["selected_equity_data"] = row.to_dict()
+        st.session_state["selected_equity_figi"] = row["Share Class FIGI"]
         st.switch_page("analyses/equity_analysis/equity_analysis.py")
 
 
+def _selected_position(response: AgGridReturn) -> int | None:
+    """
+    Read the selected row's position from the returned grid state.
+
+    Note:
+        st_aggrid assigns each row its position in the source DataFrame as
+        the AgGrid row id, so the id indexes straight back into the frame
+        without building a DataFrame of the selected rows.
+
+    Args:
+        response: The AgGrid response for the current run.
+
+    Returns:
+        int | None: Position of the selected row, or None if none selected.
+    """
+    row_ids = (response.grid_state or {}).get("rowSelection")
+    if not isinstance(row_ids, list) or not row_ids:
+        return None
+    return int(row_ids[0])
+
+
+def _render_search_bar() -> str:
+    """
+    Render the right-aligned search input above the grid.
+
+    Returns:
+        str: Text to apply as the AgGrid quick filter.
+    """
+    _, search_col = st.columns([3, 1])
+    with search_col:
+        return st.text_input(
+            "Search",
+            placeholder="Search...",
+            label_visibility="collapsed",
+        )
+
+
 def _build_grid_options(df: pd.DataFrame) -> dict[str, Any]:
     """
     Create fully-configured AgGrid options for the given DataFrame.
@@ -113,10 +168,9 @@ def _build_grouped_column_defs(flat_col_defs: list[dict]) -> list[dict]:
         if children:
             grouped.append({"headerName": group.header, "children": children})
 
-    grouped_fields = {f for group in COLUMN_GROUPS for f in group.columns}
     for cd in flat_col_defs:
         field = cd.get("field", "")
-        if field and field not in grouped_fields and not field.startswith("::"):
+        if field and field not in _GROUPED_FIELDS and not field.startswith("::"):
             grouped.append(cd)
 
     return grouped
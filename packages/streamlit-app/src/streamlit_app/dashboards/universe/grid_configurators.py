@@ -1,9 +1,13 @@
 # grid_configurators.py
 
+import functools
+from collections.abc import Iterable
+from typing import Any
+
 from st_aggrid import GridOptionsBuilder
 
 from streamlit_app.dashboards.universe.columns import (
-    FORMATTER_TABLE,
+    COLUMN_FORMATTERS,
     IDENTIFIER_COLS,
     PCT_STYLE_COLS,
 )
@@ -15,24 +19,51 @@ from streamlit_app.dashboards.universe.formatters import (
     TOOLTIP_VALUE_GETTER,
 )
 
+_COLUMN_LAYERS: tuple[tuple[Iterable[str], dict[str, Any]], ...] = (
+    # Hide identifier columns while keeping data available for tooltips
+    (IDENTIFIER_COLS, {"hide": True}),
+    # Pin Name and Symbol, attach tooltip and quick-filter to Name
+    (
+        ("Name",),
+        {
+            "minWidth": 200,
+            "pinned": "left",
+            "tooltipValueGetter": TOOLTIP_VALUE_GETTER,
+            "tooltipComponent": IDENTIFIER_TOOLTIP,
+            "getQuickFilterText": QUICK_FILTER_TEXT,
+        },
+    ),
+    (("Symbol",), {"pinned": "left"}),
+    # Classification columns with set filters
+    (("Industry", "Sector"), {"minWidth": 150, "filter": "agSetColumnFilter"}),
+    # Value formatters
+    *(
+        ((col,), {"valueFormatter": formatter, **extra_kwargs})
+        for col, (formatter, extra_kwargs) in COLUMN_FORMATTERS.items()
+    ),
+    # Green/red styling for percentage columns
+    (PCT_STYLE_COLS, {"cellStyle": PCT_STYLE}),
+    # Analyst rating colour style and set filter
+    (
+        ("Analyst Rating",),
+        {"cellStyle": ANALYST_STYLE, "filter": "agSetColumnFilter"},
+    ),
+)
+
 
 def configure_columns(gb: GridOptionsBuilder) -> None:
     """
     Apply all column configurations to the grid builder.
 
-    Orchestrates defaults, visibility, pinning, classification, formatting,
-    percentage styling, and analyst rating in sequence.
+    Applies grid-wide defaults, then configures each column once with its
+    overrides merged across all configuration layers.
 
     Args:
         gb: Grid options builder to mutate.
     """
     _configure_defaults(gb)
-    _configure_hidden_columns(gb)
-    _configure_pinned_columns(gb)
-    _configure_classification_columns(gb)
-    _apply_formatters(gb)
-    _apply_percentage_styles(gb)
-    _configure_analyst_column(gb)
+    for col, overrides in _column_overrides().items():
+        gb.configure_column(col, **overrides)
 
 
 def _configure_defaults(gb: GridOptionsBuilder) -> None:
@@ -55,84 +86,21 @@ def _configure_defaults(gb: GridOptionsBuilder) -> None:
     gb.configure_side_bar(filters_panel=True, columns_panel=True)
 
 
-def _configure_hidden_columns(gb: GridOptionsBuilder) -> None:
-    """
-    Hide identifier columns while keeping data available for tooltips.
-
-    Args:
-        gb: Grid options builder to mutate.
-    """
-    for col in IDENTIFIER_COLS:
-        gb.configure_column(col, hide=True)
-
-
-def _configure_pinned_columns(gb: GridOptionsBuilder) -> None:
-    """
-    Pin Name and Symbol to the left, attach tooltip and quick-filter to Name.
-
-    Args:
-        gb: Grid options builder to mutate.
-    """
-    gb.configure_column(
-        "Name",
-        minWidth=200,
-        pinned="left",
-        tooltipValueGetter=TOOLTIP_VALUE_GETTER,
-        tooltipComponent=IDENTIFIER_TOOLTIP,
-        getQuickFilterText=QUICK_FILTER_TEXT,
-    )
-    gb.configure_column("Symbol", pinned="left")
-
-
-def _configure_classification_columns(gb: GridOptionsBuilder) -> None:
-    """
-    Configure Industry and Sector columns with set filters.
-
-    Args:
-        gb: Grid options builder to mutate.
+@functools.cache
+def _column_overrides() -> dict[str, dict[str, Any]]:
     """
-    gb.configure_column("Industry", minWidth=150, filter="agSetColumnFilter")
-    gb.configure_column("Sector", minWidth=150, filter="agSetColumnFilter")
+    Fold the column configuration layers into one overrides dict per column.
 
+    Note:
+        Layers are applied in order, so a later layer's value wins for any
+        property set by more than one layer. The result is computed once
+        per process since the layers are static.
 
-def _configure_analyst_column(gb: GridOptionsBuilder) -> None:
-    """
-    Configure the Analyst Rating column with its unique colour style and set filter.
-
-    Args:
-        gb: Grid options builder to mutate.
-    """
-    gb.configure_column(
-        "Analyst Rating",
-        cellStyle=ANALYST_STYLE,
-        filter="agSetColumnFilter",
-    )
-
-
-def _apply_formatters(gb: GridOptionsBuilder) -> None:
-    """
-    Apply value formatters from the FORMATTER_TABLE.
-
-    Iterates each FormatterRule and assigns its JsCode formatter and extra
-    kwargs to every column in the rule.
-
-    Args:
-        gb: Grid options builder to mutate.
-    """
-    for rule in FORMATTER_TABLE:
-        for col in rule.columns:
-            gb.configure_column(col, valueFormatter=rule.formatter, **rule.extra_kwargs)
-
-
-def _apply_percentage_styles(gb: GridOptionsBuilder) -> None:
-    """
-    Colour positive/negative percentage columns green/red.
-
-    Applies the PCT_STYLE JsCode cell style to every column listed in
-    PCT_STYLE_COLS.
-
-    Args:
-        gb: Grid options builder to mutate.
+    Returns:
+        dict[str, dict[str, Any]]: Merged column properties keyed by column.
     """
-    for col in PCT_STYLE_COLS:
-        gb.configure_column(col, cellStyle=PCT_STYLE)
+    merged: dict[str, dict[str, Any]] = {}
+    for columns, overrides in _COLUMN_LAYERS:
+        for col in columns:
+            merged.setdefault(col, {}).update(overrides)
+    return merged
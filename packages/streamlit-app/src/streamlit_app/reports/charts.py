@@ -1,12 +1,30 @@
 # charts.py
 
+import numpy as np
 import plotly.graph_objects as go
+import streamlit as st
 
 from streamlit_app.reports.models import SectorFieldCoverage
 
-
+_TIER_LABELS: tuple[str, ...] = (
+    "Nano (<$50M)",
+    "Micro ($50M-$300M)",
+    "Small ($300M-$2B)",
+    "Mid ($2B-$10B)",
+    "Large ($10B-$200B)",
+    "Mega (>$200B)",
+)
+_TIER_EDGES: np.ndarray = np.array([0, 50e6, 300e6, 2e9, 10e9, 200e9, np.inf])
+_HEATMAP_COLOUR_SCALE: tuple[tuple[float, str], ...] = (
+    (0.0, "#FF4B4B"),
+    (0.5, "#FAFAFA"),
+    (1.0, "#4BB543"),
+)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
 def build_market_cap_chart(
-    values: tuple[float, ...],
+    values: np.ndarray,
 ) -> go.Figure:
     """
     Build a Plotly bar chart of market cap tier distribution.
@@ -18,24 +36,24 @@ def build_market_cap_chart(
         go.Figure: Bar chart with 6 market cap tier buckets.
     """
     labels, counts = _count_per_tier(values)
-    fig = go.Figure(
+    return go.Figure(
         data=go.Bar(
             x=labels,
             y=counts,
             marker_color="#FF4B4B",
         ),
+        layout={
+            "margin": {"l": 40, "r": 20, "t": 30, "b": 40},
+            "template": "plotly_white",
+            "xaxis_title": "Market Cap Tier",
+            "yaxis_title": "No. of Equities",
+        },
     )
-    fig.update_layout(
-        margin={"l": 40, "r": 20, "t": 30, "b": 40},
-        template="plotly_white",
-        xaxis_title="Market Cap Tier",
-        yaxis_title="No. of Equities",
-    )
-    return fig
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def build_completeness_chart(
-    values: tuple[int, ...],
+    values: np.ndarray,
 ) -> go.Figure:
     """
     Build a Plotly bar chart of per-equity completeness scores.
@@ -49,7 +67,7 @@ def build_completeness_chart(
     labels, counts = _count_per_score(values)
     total = len(values)
     pcts = _score_percentages(counts, total)
-    fig = go.Figure(
+    return go.Figure(
         data=go.Bar(
             x=labels,
             y=counts,
@@ -59,18 +77,17 @@ def build_completeness_chart(
                 "%{y:,} equities (%{customdata:.1f}%) with %{x} fields<extra></extra>"
             ),
         ),
+        layout={
+            "bargap": 0.15,
+            "margin": {"l": 40, "r": 20, "t": 30, "b": 40},
+            "template": "plotly_white",
+            "xaxis": {"title": "Fields Populated (out of 31)", "dtick": 5},
+            "yaxis_title": "No. of Equities",
+        },
     )
-    fig.update_layout(
-        bargap=0.15,
-        margin={"l": 40, "r": 20, "t": 30, "b": 40},
-        template="plotly_white",
-        xaxis_title="Fields Populated (out of 31)",
-        xaxis={"dtick": 5},
-        yaxis_title="No. of Equities",
-    )
-    return fig
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def build_sector_heatmap(
     coverage: SectorFieldCoverage,
 ) -> go.Figure:
@@ -83,32 +100,34 @@ def build_sector_heatmap(
     Returns:
         go.Figure: Heatmap with red-to-white-to-green colour scale.
     """
-    fig = go.Figure(
+    return go.Figure(
         data=go.Heatmap(
             z=coverage.percentages,
             x=coverage.fields,
             y=coverage.sectors,
-            colorscale=_heatmap_colour_scale(),
+            colorscale=_HEATMAP_COLOUR_SCALE,
             zmin=0,
             zmax=100,
             hovertemplate="%{y}<br>%{x}: %{z:.1f}%<extra></extra>",
         ),
+        layout={
+            "margin": {"l": 20, "r": 20, "t": 30, "b": 40},
+            "template": "plotly_white",
+            "height": _heatmap_height(len(coverage.sectors)),
+            "xaxis": {"tickangle": -45},
+        },
     )
-    fig.update_layout(
-        margin={"l": 20, "r": 20, "t": 30, "b": 40},
-        template="plotly_white",
-        height=_heatmap_height(len(coverage.sectors)),
-        xaxis={"tickangle": -45},
-    )
-    return fig
 
 
 def _count_per_tier(
-    values: tuple[float, ...],
+    values: np.ndarray,
 ) -> tuple[tuple[str, ...], tuple[int, ...]]:
     """
     Bucket market cap values into standard financial tiers.
 
+    Values are binned in a single vectorised histogram pass over the tier
+    edges rather than rescanned once per tier.
+
     Args:
         values: Raw positive market cap values.
 
@@ -116,25 +135,18 @@ def _count_per_tier(
         tuple[tuple[str, ...], tuple[int, ...]]: Parallel tuples
             of tier labels and counts.
     """
-    thresholds = (
-        ("Nano (<$50M)", 0, 50e6),
-        ("Micro ($50M-$300M)", 50e6, 300e6),
-        ("Small ($300M-$2B)", 300e6, 2e9),
-        ("Mid ($2B-$10B)", 2e9, 10e9),
-        ("Large ($10B-$200B)", 10e9, 200e9),
-        ("Mega (>$200B)", 200e9, float("inf")),
-    )
-    labels = tuple(t[0] for t in thresholds)
-    counts = tuple(sum(1 for v in values if lo <= v < hi) for _, lo, hi in thresholds)
-    return labels, counts
+    counts, _ = np.histogram(values, bins=_TIER_EDGES)
+    return _TIER_LABELS, tuple(counts.tolist())
 
 
 def _count_per_score(
-    values: tuple[int, ...],
+    values: np.ndarray,
 ) -> tuple[tuple[int, ...], tuple[int, ...]]:
     """
     Count equities at each completeness score from 0 to 31.
 
+    All scores are tallied in one np.bincount pass over the values.
+
     Args:
         values: Per-equity field counts (0-31).
 
@@ -142,9 +154,8 @@ def _count_per_score(
         tuple[tuple[int, ...], tuple[int, ...]]: Parallel tuples
             of score labels and equity counts.
     """
-    scores = range(32)
-    counts = tuple(values.count(s) for s in scores)
-    return tuple(scores), counts
+    counts = np.bincount(values, minlength=32)[:32]
+    return tuple(range(32)), tuple(counts.tolist())
 
 
 def _score_percentages(
@@ -163,17 +174,7 @@ def _score_percentages(
     """
     if not total:
         return tuple(0.0 for _ in counts)
-    return tuple(c / total * 100 for c in counts)
-
-
-def _heatmap_colour_scale() -> list[list[float | str]]:
-    """
-    Return the red-to-white-to-green colour scale for the heatmap.
-
-    Returns:
-        list[list[float | str]]: Plotly-compatible colour scale.
-    """
-    return [[0, "#FF4B4B"], [0.5, "#FAFAFA"], [1.0, "#4BB543"]]
+    return tuple((np.asarray(counts, dtype=np.float64) / total * 100).tolist())
 
 
 def _heatmap_height(num_sectors: int) -> int:
@@ -1,258 +1,208 @@
 # checks.py
 
-from decimal import Decimal
+from collections.abc import Callable
+from operator import itemgetter
 
+import numpy as np
+import pandas as pd
 from equity_aggregator import CanonicalEquity
 
-from streamlit_app.reports.fields import has_field
 from streamlit_app.reports.models import ConsistencyFinding
 
+_CHECK_FIELDS: tuple[str, ...] = (
+    "last_price",
+    "market_cap",
+    "fifty_two_week_min",
+    "fifty_two_week_max",
+    "dividend_yield",
+    "held_insiders",
+    "held_institutions",
+    "revenue_per_share",
+    "profit_margin",
+    "gross_margin",
+    "operating_margin",
+    "return_on_equity",
+    "return_on_assets",
+    "revenue",
+    "trailing_pe",
+    "price_to_book",
+    "trailing_eps",
+)
+_CHECK_GETTER: Callable[[dict], tuple] = itemgetter(*_CHECK_FIELDS)
+
 
 def run_cross_field_checks(
-    equities: list[CanonicalEquity],
+    df: pd.DataFrame,
 ) -> tuple[ConsistencyFinding, ...]:
     """
     Detect cross-field logic inconsistencies across all equities.
 
     Args:
-        equities: All canonical equities.
+        df: Financials frame from build_financials_frame.
 
     Returns:
         tuple[ConsistencyFinding, ...]: Findings for each consistency
             check performed.
     """
-    total = len(equities)
+    total = len(df)
+    price, market_cap = df["last_price"].notna(), df["market_cap"].notna()
     return (
-        _finding(
-            "Price recorded without market cap",
-            equities,
-            total,
-            lambda eq: has_field(eq, "last_price") and not has_field(eq, "market_cap"),
-        ),
-        _finding(
-            "Market cap recorded without price",
-            equities,
-            total,
-            lambda eq: has_field(eq, "market_cap") and not has_field(eq, "last_price"),
-        ),
-        _finding(
-            "Price and market cap both missing",
-            equities,
-            total,
-            lambda eq: (
-                not has_field(eq, "last_price") and not has_field(eq, "market_cap")
-            ),
-        ),
+        _finding("Price recorded without market cap", price & ~market_cap, total),
+        _finding("Market cap recorded without price", market_cap & ~price, total),
+        _finding("Price and market cap both missing", ~price & ~market_cap, total),
         _finding(
             "Partial 52-week range",
-            equities,
+            df["fifty_two_week_min"].notna() != df["fifty_two_week_max"].notna(),
             total,
-            lambda eq: (
-                has_field(eq, "fifty_two_week_min")
-                != has_field(eq, "fifty_two_week_max")
-            ),
         ),
     )
 
 
 def run_ratio_checks(
-    equities: list[CanonicalEquity],
+    df: pd.DataFrame,
 ) -> tuple[ConsistencyFinding, ...]:
     """
     Detect logically inconsistent financial ratio relationships.
 
     Args:
-        equities: All canonical equities.
+        df: Financials frame from build_financials_frame.
 
     Returns:
         tuple[ConsistencyFinding, ...]: Findings for each ratio
             consistency check performed.
     """
-    total = len(equities)
+    total = len(df)
     return (
         _finding(
             "Profit margin exceeds gross margin",
-            equities,
+            df["profit_margin"] > df["gross_margin"],
             total,
-            _profit_exceeds_gross,
         ),
         _finding(
             "Operating margin exceeds gross margin",
-            equities,
+            df["operating_margin"] > df["gross_margin"],
             total,
-            _operating_exceeds_gross,
         ),
         _finding(
             "Trailing P/E without EPS",
-            equities,
+            _present_without(df, "trailing_pe", "trailing_eps"),
             total,
-            lambda eq: (
-                has_field(eq, "trailing_pe") and not has_field(eq, "trailing_eps")
-            ),
         ),
         _finding(
             "Revenue/share without revenue",
-            equities,
+            _present_without(df, "revenue_per_share", "revenue"),
             total,
-            lambda eq: (
-                has_field(eq, "revenue_per_share") and not has_field(eq, "revenue")
-            ),
         ),
         _finding(
             "Price/book without price",
-            equities,
+            _present_without(df, "price_to_book", "last_price"),
             total,
-            lambda eq: (
-                has_field(eq, "price_to_book") and not has_field(eq, "last_price")
-            ),
         ),
     )
 
 
 def run_plausibility_checks(
-    equities: list[CanonicalEquity],
+    df: pd.DataFrame,
 ) -> tuple[ConsistencyFinding, ...]:
     """
     Detect individual field values outside plausible ranges.
 
     Args:
-        equities: All canonical equities.
+        df: Financials frame from build_financials_frame.
 
     Returns:
         tuple[ConsistencyFinding, ...]: Findings for each value
             plausibility check performed.
     """
-    total = len(equities)
+    total = len(df)
     return (
         _finding(
             "52-week min exceeds max",
-            equities,
-            total,
-            _has_inverted_range,
-        ),
-        _finding(
-            "Price outside 52-week range",
-            equities,
-            total,
-            _price_outside_range,
-        ),
-        _finding(
-            "Extreme dividend yield (>100%)",
-            equities,
-            total,
-            lambda eq: (
-                eq.financials.dividend_yield is not None
-                and eq.financials.dividend_yield > 1
-            ),
-        ),
-        _finding(
-            "Extreme trailing P/E (\u00b11000)",
-            equities,
-            total,
-            _has_extreme_pe,
-        ),
-        _finding(
-            "Holdings exceed 100%",
-            equities,
-            total,
-            _holdings_exceed,
-        ),
-        _finding(
-            "Extreme ROE or ROA (\u00b1500%)",
-            equities,
+            df["fifty_two_week_min"] > df["fifty_two_week_max"],
             total,
-            _has_extreme_return,
         ),
+        _finding("Price outside 52-week range", _price_outside_range(df), total),
+        _finding("Extreme dividend yield (>100%)", df["dividend_yield"] > 1, total),
+        _finding("Extreme trailing P/E (\u00b11000)", _has_extreme_pe(df), total),
+        _finding("Holdings exceed 100%", _holdings_exceed(df), total),
+        _finding("Extreme ROE or ROA (\u00b1500%)", _has_extreme_return(df), total),
     )
 
 
+def build_financials_frame(equities: list[CanonicalEquity]) -> pd.DataFrame:
+    """
+    Materialise the financial fields used by the checks as float columns.
+
+    All fields of an equity are fetched by one precompiled itemgetter over
+    the financials model's instance __dict__ and converted from Decimal to
+    a float64 matrix, with missing values becoming NaN, so every check can
+    be evaluated as a vectorised column expression. The frame is built
+    once and shared by all of the run_*_checks functions.
+
+    Args:
+        equities: All canonical equities.
+
+    Returns:
+        pd.DataFrame: One float64 column per field in _CHECK_FIELDS.
+    """
+    rows = [_CHECK_GETTER(vars(eq.financials)) for eq in equities]
+    values = np.array(rows, dtype=np.float64).reshape(-1, len(_CHECK_FIELDS))
+    return pd.DataFrame(values, columns=list(_CHECK_FIELDS), copy=False)
+
+
 def _finding(
     description: str,
-    equities: list[CanonicalEquity],
+    mask: pd.Series,
     total: int,
-    predicate: object,
 ) -> ConsistencyFinding:
     """
     Build a ConsistencyFinding by counting matches.
 
     Args:
         description: Human-readable check description.
-        equities: All canonical equities.
+        mask: Boolean Series, True for affected equities.
         total: Total number of equities.
-        predicate: Callable returning True for affected equities.
 
     Returns:
         ConsistencyFinding: The finding for this check.
     """
-    count = sum(1 for eq in equities if predicate(eq))  # type: ignore[operator]
     return ConsistencyFinding(
         description=description,
-        count=count,
+        count=int(mask.sum()),
         total=total,
     )
 
 
-def _profit_exceeds_gross(equity: CanonicalEquity) -> bool:
-    """
-    Check whether profit margin is greater than gross margin.
-
-    Args:
-        equity: A single canonical equity.
-
-    Returns:
-        bool: True if both margins are present and profit exceeds gross.
+def _present_without(df: pd.DataFrame, present: str, missing: str) -> pd.Series:
     """
-    profit = equity.financials.profit_margin
-    gross = equity.financials.gross_margin
-    return profit is not None and gross is not None and profit > gross
-
-
-def _operating_exceeds_gross(equity: CanonicalEquity) -> bool:
-    """
-    Check whether operating margin is greater than gross margin.
+    Flag equities where one field is populated but another is not.
 
     Args:
-        equity: A single canonical equity.
+        df: Financials frame from build_financials_frame.
+        present: Column expected to be populated.
+        missing: Column expected to be missing.
 
     Returns:
-        bool: True if both margins are present and operating exceeds gross.
+        pd.Series: True where present is populated and missing is NaN.
     """
-    operating = equity.financials.operating_margin
-    gross = equity.financials.gross_margin
-    return operating is not None and gross is not None and operating > gross
+    return df[present].notna() & df[missing].isna()
 
 
-def _has_extreme_pe(equity: CanonicalEquity) -> bool:
+def _has_extreme_pe(df: pd.DataFrame) -> pd.Series:
     """
     Check whether trailing P/E has extreme magnitude.
 
     Args:
-        equity: A single canonical equity.
+        df: Financials frame from build_financials_frame.
 
     Returns:
-        bool: True if trailing P/E is present and exceeds ±1000.
+        pd.Series: True where trailing P/E is present and exceeds ±1000.
     """
     pe_threshold = 1000
-    pe = equity.financials.trailing_pe
-    return pe is not None and abs(pe) > pe_threshold
-
-
-def _has_inverted_range(equity: CanonicalEquity) -> bool:
-    """
-    Check whether the 52-week minimum exceeds the maximum.
+    return df["trailing_pe"].abs() > pe_threshold
 
-    Args:
-        equity: A single canonical equity.
 
-    Returns:
-        bool: True if both bounds are present and min exceeds max.
-    """
-    min_val = equity.financials.fifty_two_week_min
-    max_val = equity.financials.fifty_two_week_max
-    return min_val is not None and max_val is not None and min_val > max_val
-
-
-def _price_outside_range(equity: CanonicalEquity) -> bool:
+def _price_outside_range(df: pd.DataFrame) -> pd.Series:
     """
     Check whether the last price is outside the 52-week range.
 
@@ -261,21 +211,21 @@ def _price_outside_range(equity: CanonicalEquity) -> bool:
         stale range data.
 
     Args:
-        equity: A single canonical equity.
+        df: Financials frame from build_financials_frame.
 
     Returns:
-        bool: True if price, min, and max are all present and price
+        pd.Series: True where price, min, and max are all present and price
             falls below min or above max with 5% tolerance.
     """
-    price = equity.financials.last_price
-    min_val = equity.financials.fifty_two_week_min
-    max_val = equity.financials.fifty_two_week_max
-    if price is None or min_val is None or max_val is None:
-        return False
-    return price < min_val or price > max_val * Decimal("1.05")
+    tolerance = 1.05
+    price = df["last_price"]
+    min_val = df["fifty_two_week_min"]
+    max_val = df["fifty_two_week_max"]
+    complete = price.notna() & min_val.notna() & max_val.notna()
+    return complete & ((price < min_val) | (price > max_val * tolerance))
 
 
-def _holdings_exceed(equity: CanonicalEquity) -> bool:
+def _holdings_exceed(df: pd.DataFrame) -> pd.Series:
     """
     Check whether combined holdings exceed 105%.
 
@@ -283,31 +233,26 @@ def _holdings_exceed(equity: CanonicalEquity) -> bool:
         Applies a 5% tolerance to accommodate rounding across sources.
 
     Args:
-        equity: A single canonical equity.
+        df: Financials frame from build_financials_frame.
 
     Returns:
-        bool: True if both holdings are present and sum exceeds 1.05.
+        pd.Series: True where both holdings are present and sum exceeds 1.05.
     """
-    insiders = equity.financials.held_insiders
-    institutions = equity.financials.held_institutions
-    if insiders is None or institutions is None:
-        return False
-    return insiders + institutions > Decimal("1.05")
+    tolerance = 1.05
+    return df["held_insiders"] + df["held_institutions"] > tolerance
 
 
-def _has_extreme_return(equity: CanonicalEquity) -> bool:
+def _has_extreme_return(df: pd.DataFrame) -> pd.Series:
     """
     Check whether ROE or ROA has extreme magnitude.
 
     Args:
-        equity: A single canonical equity.
+        df: Financials frame from build_financials_frame.
 
     Returns:
-        bool: True if either metric is present and exceeds \u00b1500%.
+        pd.Series: True where either metric is present and exceeds \u00b1500%.
     """
     threshold = 5
-    roe = equity.financials.return_on_equity
-    roa = equity.financials.return_on_assets
-    if roe is not None and abs(roe) > threshold:
-        return True
-    return roa is not None and abs(roa) > threshold
+    return (df["return_on_equity"].abs() > threshold) | (
+        df["return_on_assets"].abs() > threshold
+    )
@@ -1,31 +1,76 @@
 # data_provider.py
 
-import statistics
+from collections.abc import Callable, Iterable
+from datetime import date
+from operator import attrgetter, itemgetter
+from typing import NamedTuple
 
+import numpy as np
 import streamlit as st
 from equity_aggregator import CanonicalEquity, retrieve_canonical_equities
 
 from streamlit_app.reports.checks import (
+    build_financials_frame,
     run_cross_field_checks,
     run_plausibility_checks,
     run_ratio_checks,
 )
 from streamlit_app.reports.fields import (
-    financial_fields,
-    has_field,
-    heatmap_fields,
-    identity_fields,
+    FINANCIAL_ATTRS,
+    FINANCIAL_FIELDS,
+    HEATMAP_FIELDS,
+    IDENTITY_ATTRS,
+    IDENTITY_FIELDS,
 )
 from streamlit_app.reports.models import (
     CompletenessDistribution,
+    ConsistencyFinding,
     CoverageReport,
     FieldCoverage,
     MarketCapDistribution,
     SectorFieldCoverage,
 )
 
+# Read field values straight from each model's instance __dict__
+_IDENTITY_GETTER: Callable[[dict], tuple] = itemgetter(*IDENTITY_ATTRS)
+_FINANCIAL_GETTER: Callable[[dict], tuple] = itemgetter(*FINANCIAL_ATTRS)
+_MARKET_CAP_INDEX: int = FINANCIAL_ATTRS.index("market_cap")
+_SECTOR_INDEX: int = FINANCIAL_ATTRS.index("sector")
+_HEATMAP_INDICES: list[int] = [
+    FINANCIAL_ATTRS.index(attr) for attr, _ in HEATMAP_FIELDS
+]
+
+
+class _EquityColumns(NamedTuple):
+    """
+    Columnar NumPy snapshot of the equity fields aggregated by the reports.
+
+    Note:
+        The populated matrices hold one row per equity and one column per
+        field in IDENTITY_ATTRS or FINANCIAL_ATTRS. Missing market caps
+        are NaN and missing sectors are None.
+    """
+
+    identity_populated: np.ndarray
+    financial_populated: np.ndarray
+    market_cap: np.ndarray
+    sector: np.ndarray
+
+
+class _ReportBundle(NamedTuple):
+    """
+    Every integrity report section, computed together from one fetch.
+    """
+
+    coverage: CoverageReport
+    market_cap: MarketCapDistribution
+    completeness: CompletenessDistribution
+    sector_coverage: SectorFieldCoverage
+    cross_field: tuple[ConsistencyFinding, ...]
+    ratio: tuple[ConsistencyFinding, ...]
+    plausibility: tuple[ConsistencyFinding, ...]
+
 
-@st.cache_resource(ttl=3600, show_spinner=False)
 def load_coverage_report() -> CoverageReport:
     """
     Fetch all canonical equities and compute field coverage.
@@ -34,28 +79,9 @@ def load_coverage_report() -> CoverageReport:
         CoverageReport: Coverage statistics for identity and
             financial fields.
     """
-    equities = _load_equities()
-    snapshot_date = equities[0].snapshot_date if equities else None
-    return CoverageReport(
-        total_equities=len(equities),
-        snapshot_date=snapshot_date,
-        total_snapshots=_count_total_snapshots(equities),
-        distinct_sectors=_count_distinct(equities, "sector"),
-        distinct_industries=_count_distinct(equities, "industry"),
-        identity_coverage=_compute_coverage(
-            equities,
-            "identity",
-            identity_fields(),
-        ),
-        financial_coverage=_compute_coverage(
-            equities,
-            "financials",
-            financial_fields(),
-        ),
-    )
+    return _load_report_bundle().coverage
 
 
-@st.cache_data(ttl=3600)
 def load_market_cap_distribution() -> MarketCapDistribution:
     """
     Compute market capitalisation distribution statistics.
@@ -64,16 +90,9 @@ def load_market_cap_distribution() -> MarketCapDistribution:
         MarketCapDistribution: Count, median, mean, and raw values
             for equities with reported market cap.
     """
-    values = _extract_market_caps(_load_equities())
-    return MarketCapDistribution(
-        count=len(values),
-        median=statistics.median(values) if values else 0.0,
-        mean=statistics.mean(values) if values else 0.0,
-        values=values,
-    )
+    return _load_report_bundle().market_cap
 
 
-@st.cache_data(ttl=3600)
 def load_cross_field_consistency() -> tuple:
     """
     Detect cross-field logic inconsistencies across all equities.
@@ -82,10 +101,9 @@ def load_cross_field_consistency() -> tuple:
         tuple[ConsistencyFinding, ...]: Findings for each consistency
             check performed.
     """
-    return run_cross_field_checks(_load_equities())
+    return _load_report_bundle().cross_field
 
 
-@st.cache_data(ttl=3600)
 def load_completeness_distribution() -> CompletenessDistribution:
     """
     Compute per-equity field completeness distribution.
@@ -94,16 +112,9 @@ def load_completeness_distribution() -> CompletenessDistribution:
         CompletenessDistribution: Count, median, mean, and raw scores
             (0-31) for each equity.
     """
-    scores = _compute_completeness_scores(_load_equities())
-    return CompletenessDistribution(
-        count=len(scores),
-        median=statistics.median(scores) if scores else 0,
-        mean=statistics.mean(scores) if scores else 0,
-        values=scores,
-    )
+    return _load_report_bundle().completeness
 
 
-@st.cache_data(ttl=3600)
 def load_sector_field_coverage() -> SectorFieldCoverage:
     """
     Compute per-field coverage percentages grouped by sector.
@@ -112,21 +123,9 @@ def load_sector_field_coverage() -> SectorFieldCoverage:
         SectorFieldCoverage: Sectors, field labels, and a 2D
             percentages matrix.
     """
-    grouped = _group_by_sector(_load_equities())
-    fields = heatmap_fields()
-    sector_rows = {s: _sector_coverage_row(grouped[s], fields) for s in grouped}
-    ranked = sorted(sector_rows.items(), key=lambda p: _mean(p[1]))
-    col_order = _rank_columns_by_coverage(
-        tuple(row for _, row in ranked),
-    )
-    return SectorFieldCoverage(
-        sectors=tuple(s for s, _ in ranked),
-        fields=tuple(fields[i][1] for i in col_order),
-        percentages=tuple(tuple(row[i] for i in col_order) for _, row in ranked),
-    )
+    return _load_report_bundle().sector_coverage
 
 
-@st.cache_data(ttl=3600)
 def load_financial_ratio_consistency() -> tuple:
     """
     Detect logically inconsistent financial ratio relationships.
@@ -135,10 +134,9 @@ def load_financial_ratio_consistency() -> tuple:
         tuple[ConsistencyFinding, ...]: Findings for each ratio
             consistency check performed.
     """
-    return run_ratio_checks(_load_equities())
+    return _load_report_bundle().ratio
 
 
-@st.cache_data(ttl=3600)
 def load_value_plausibility() -> tuple:
     """
     Detect individual field values outside plausible ranges.
@@ -147,256 +145,319 @@ def load_value_plausibility() -> tuple:
         tuple[ConsistencyFinding, ...]: Findings for each value
             plausibility check performed.
     """
-    return run_plausibility_checks(_load_equities())
+    return _load_report_bundle().plausibility
 
 
-@st.cache_resource(ttl=3600)
-def _load_equities() -> list[CanonicalEquity]:
+@st.cache_resource(ttl=3600, show_spinner=False)
+def _load_report_bundle() -> _ReportBundle:
     """
-    Shared cached loader for canonical equities.
+    Shared cached computation of every integrity report section.
+
+    The equities are fetched once and converted once into the columnar
+    snapshot and the checks frame, from which all sections are built
+    together, so the report is computed and cached as a single result.
 
     Returns:
-        list[CanonicalEquity]: All canonical equities.
-    """
-    return retrieve_canonical_equities()
+        _ReportBundle: All integrity report sections.
+    """
+    equities = retrieve_canonical_equities()
+    columns = _build_equity_columns(equities)
+    financials = build_financials_frame(equities)
+    return _ReportBundle(
+        coverage=_build_coverage_report(equities, columns),
+        market_cap=_build_market_cap_distribution(columns.market_cap),
+        completeness=_build_completeness_distribution(columns.financial_populated),
+        sector_coverage=_build_sector_field_coverage(columns),
+        cross_field=_by_count(run_cross_field_checks(financials)),
+        ratio=_by_count(run_ratio_checks(financials)),
+        plausibility=_by_count(run_plausibility_checks(financials)),
+    )
 
 
-def _extract_market_caps(
+def _build_coverage_report(
     equities: list[CanonicalEquity],
-) -> tuple[float, ...]:
+    columns: _EquityColumns,
+) -> CoverageReport:
     """
-    Filter equities to those with a positive market cap.
+    Compute field coverage and summary counts for the equities.
 
     Args:
-        equities: List of CanonicalEquity instances.
+        equities: All canonical equities.
+        columns: Columnar snapshot of the equities.
 
     Returns:
-        tuple[float, ...]: Positive market cap values.
+        CoverageReport: Coverage statistics for identity and
+            financial fields.
     """
-    return tuple(
-        float(eq.financials.market_cap)
-        for eq in equities
-        if eq.financials.market_cap is not None and eq.financials.market_cap > 0
+    snapshot_date = equities[0].snapshot_date if equities else None
+    total_snapshots, distinct_sectors, distinct_industries = _count_distinct(
+        equities,
+    )
+    return CoverageReport(
+        total_equities=len(equities),
+        snapshot_date=snapshot_date,
+        snapshot_date_formatted=_format_snapshot_date(snapshot_date),
+        total_snapshots=total_snapshots,
+        distinct_sectors=distinct_sectors,
+        distinct_industries=distinct_industries,
+        identity_coverage=_compute_coverage(
+            IDENTITY_FIELDS,
+            columns.identity_populated.sum(axis=0).tolist(),
+            len(equities),
+        ),
+        financial_coverage=_compute_coverage(
+            FINANCIAL_FIELDS,
+            columns.financial_populated.sum(axis=0).tolist(),
+            len(equities),
+        ),
     )
 
 
-def _count_total_snapshots(
-    equities: list[CanonicalEquity],
-) -> int:
+def _build_market_cap_distribution(market_cap: np.ndarray) -> MarketCapDistribution:
     """
-    Count distinct non-None snapshot dates across all equities.
+    Compute market capitalisation distribution statistics.
 
     Args:
-        equities: List of CanonicalEquity instances.
+        market_cap: Market cap of each equity, NaN where missing.
 
     Returns:
-        int: Number of unique snapshot dates.
+        MarketCapDistribution: Count, median, mean, and raw values
+            for equities with reported market cap.
     """
-    return len(
-        {eq.snapshot_date for eq in equities if eq.snapshot_date is not None},
+    values = market_cap[market_cap > 0]
+    median, mean = _median_and_mean(values)
+    return MarketCapDistribution(
+        count=len(values),
+        median=median,
+        mean=mean,
+        values=values,
     )
 
 
-def _count_distinct(
-    equities: list[CanonicalEquity],
-    attr: str,
-) -> int:
+def _build_completeness_distribution(
+    populated: np.ndarray,
+) -> CompletenessDistribution:
     """
-    Count distinct non-None values for a financials attribute.
+    Compute per-equity field completeness distribution.
 
     Args:
-        equities: List of CanonicalEquity instances.
-        attr: Attribute name on the financials group.
+        populated: Financial populated flags (equities x fields).
 
     Returns:
-        int: Number of unique non-None values.
-    """
-    return len(
-        {
-            getattr(eq.financials, attr)
-            for eq in equities
-            if getattr(eq.financials, attr, None) is not None
-        }
+        CompletenessDistribution: Count, median, mean, and raw scores
+            (0-31) for each equity.
+    """
+    scores = populated.sum(axis=1)
+    median, mean = _median_and_mean(scores)
+    return CompletenessDistribution(
+        count=len(scores),
+        median=median,
+        mean=mean,
+        values=scores,
     )
 
 
-def _compute_coverage(
-    equities: list[object],
-    group: str,
-    fields: tuple[tuple[str, str], ...],
-) -> tuple[FieldCoverage, ...]:
+def _build_sector_field_coverage(columns: _EquityColumns) -> SectorFieldCoverage:
     """
-    Count non-None values for each field across all equities.
+    Compute per-field coverage percentages grouped by sector.
 
     Args:
-        equities: List of CanonicalEquity instances.
-        group: Attribute group name ("identity" or "financials").
-        fields: Tuples of (attribute_name, display_label).
+        columns: Columnar snapshot of the equities.
 
     Returns:
-        tuple[FieldCoverage, ...]: Coverage for each field.
-    """
-    total = len(equities)
-    return tuple(
-        FieldCoverage(
-            label=label,
-            count=_count_populated(equities, group, attr),
-            total=total,
-        )
-        for attr, label in fields
+        SectorFieldCoverage: Sectors, field labels, and a 2D
+            percentages matrix.
+    """
+    populated = columns.financial_populated[:, _HEATMAP_INDICES]
+    sectors, matrix = _coverage_by_sector(columns.sector, populated)
+    row_order = np.argsort(matrix.mean(axis=1), kind="stable")
+    col_order = _rank_columns_by_coverage(matrix)
+    return SectorFieldCoverage(
+        sectors=tuple(sectors[row_order].tolist()),
+        fields=tuple(HEATMAP_FIELDS[i][1] for i in col_order),
+        percentages=tuple(
+            map(tuple, matrix[np.ix_(row_order, col_order)].tolist()),
+        ),
     )
 
 
-def _count_populated(
-    equities: list[object],
-    group: str,
-    attr: str,
-) -> int:
+def _format_snapshot_date(snapshot_date: str | None) -> str | None:
     """
-    Count equities where the given nested attribute is not None.
+    Format a YYYY-MM-DD snapshot date for display as DD/MM/YYYY.
 
     Args:
-        equities: List of CanonicalEquity instances.
-        group: Attribute group name (e.g. "identity").
-        attr: Attribute name within the group.
+        snapshot_date: Snapshot date in ISO format, or None.
 
     Returns:
-        int: Number of equities with a non-None value.
+        str | None: The display date, or None if there is no snapshot.
     """
-    return sum(
-        1
-        for eq in equities
-        if getattr(getattr(eq, group, None), attr, None) is not None
-    )
+    if not snapshot_date:
+        return None
+    return date.fromisoformat(snapshot_date).strftime("%d/%m/%Y")
 
 
-def _mean(values: tuple[float, ...]) -> float:
+def _count_distinct(equities: list[CanonicalEquity]) -> tuple[int, int, int]:
     """
-    Compute the arithmetic mean of a tuple of floats.
+    Count distinct snapshot dates, sectors and industries in one pass.
 
     Args:
-        values: Numeric values.
+        equities: List of CanonicalEquity instances.
 
     Returns:
-        float: The mean, or 0.0 if the tuple is empty.
+        tuple[int, int, int]: Numbers of unique non-None snapshot dates,
+            sectors and industries.
     """
-    if not values:
-        return 0.0
-    return sum(values) / len(values)
+    snapshots, sectors, industries = set(), set(), set()
+    for eq in equities:
+        snapshots.add(eq.snapshot_date)
+        sectors.add(eq.financials.sector)
+        industries.add(eq.financials.industry)
+    return tuple(len(values - {None}) for values in (snapshots, sectors, industries))
 
 
-def _rank_columns_by_coverage(
-    rows: tuple[tuple[float, ...], ...],
-) -> tuple[int, ...]:
+def _compute_coverage(
+    fields: tuple[tuple[str, str], ...],
+    counts: tuple[int, ...],
+    total: int,
+) -> tuple[FieldCoverage, ...]:
     """
-    Return column indices sorted by mean coverage descending.
+    Pair each field's label with its populated count, best covered first.
 
     Args:
-        rows: 2D percentages matrix (sectors x fields).
+        fields: Tuples of (attribute_name, display_label).
+        counts: Populated counts aligned with fields.
+        total: Total number of equities.
 
     Returns:
-        tuple[int, ...]: Column indices ordered highest mean first.
+        tuple[FieldCoverage, ...]: Coverage for each field, ordered by
+            populated count descending so the tables need no sorting.
     """
-    if not rows:
-        return ()
-    num_cols = len(rows[0])
-    col_means = tuple(sum(row[c] for row in rows) / len(rows) for c in range(num_cols))
-    return tuple(
-        i
-        for i, _ in sorted(
-            enumerate(col_means),
-            key=lambda pair: pair[1],
-            reverse=True,
-        )
+    return _by_count(
+        FieldCoverage(label=label, count=count, total=total)
+        for (_, label), count in zip(fields, counts, strict=True)
     )
 
 
-def _compute_completeness_scores(
-    equities: list[CanonicalEquity],
-) -> tuple[int, ...]:
+def _by_count(
+    items: Iterable[FieldCoverage | ConsistencyFinding],
+) -> tuple[FieldCoverage | ConsistencyFinding, ...]:
     """
-    Count populated financial fields for each equity.
+    Order coverage entries or findings by count, highest first.
+
+    Note:
+        Every entry in one table shares the same total, so ordering by
+        count matches ordering by percentage. Sorting once here means the
+        renderers display the tables as given, with ties kept in their
+        original order.
 
     Args:
-        equities: All canonical equities.
+        items: Field coverage entries or consistency findings.
 
     Returns:
-        tuple[int, ...]: Per-equity scores (0-31).
+        tuple[FieldCoverage | ConsistencyFinding, ...]: The entries,
+            highest count first.
     """
-    fields = financial_fields()
-    return tuple(_count_equity_fields(eq, fields) for eq in equities)
+    return tuple(sorted(items, key=attrgetter("count"), reverse=True))
 
 
-def _count_equity_fields(
-    equity: CanonicalEquity,
-    fields: tuple[tuple[str, str], ...],
-) -> int:
+def _median_and_mean(values: np.ndarray) -> tuple[float, float]:
     """
-    Count how many financial fields are populated for one equity.
+    Compute the median and arithmetic mean of a numeric array.
 
     Args:
-        equity: A single canonical equity.
-        fields: Financial field specifications.
+        values: Numeric values.
 
     Returns:
-        int: Number of non-None fields.
+        tuple[float, float]: The median and mean, or zeros if empty.
     """
-    return sum(1 for attr, _ in fields if has_field(equity, attr))
+    if not len(values):
+        return 0.0, 0.0
+    return float(np.median(values)), float(values.mean())
 
 
-def _group_by_sector(
-    equities: list[CanonicalEquity],
-) -> dict[str, list[CanonicalEquity]]:
+def _rank_columns_by_coverage(rows: np.ndarray) -> tuple[int, ...]:
     """
-    Group equities by sector, excluding those without one.
+    Return column indices sorted by mean coverage descending.
 
     Args:
-        equities: All canonical equities.
+        rows: 2D percentages matrix (sectors x fields).
 
     Returns:
-        dict[str, list[CanonicalEquity]]: Equities keyed by sector.
+        tuple[int, ...]: Column indices ordered highest mean first, with
+            ties kept in their original order.
     """
-    grouped: dict[str, list[CanonicalEquity]] = {}
-    for eq in equities:
-        if eq.financials.sector is not None:
-            grouped.setdefault(eq.financials.sector, []).append(eq)
-    return grouped
+    if not len(rows):
+        return ()
+    return tuple(np.argsort(-rows.mean(axis=0), kind="stable").tolist())
 
 
-def _sector_coverage_row(
-    equities: list[CanonicalEquity],
-    fields: tuple[tuple[str, str], ...],
-) -> tuple[float, ...]:
+def _build_equity_columns(equities: list[CanonicalEquity]) -> _EquityColumns:
     """
-    Compute per-field coverage percentages for a sector group.
+    Convert the equities into NumPy columns in a single pass.
+
+    Each model's fields are fetched once by a precompiled itemgetter over
+    its instance __dict__, which skips per-field attribute lookup, so
+    every downstream statistic is a vectorised reduction over contiguous
+    arrays rather than a walk over Python objects.
 
     Args:
-        equities: Equities within a single sector.
-        fields: Financial field specifications.
+        equities: All canonical equities.
 
     Returns:
-        tuple[float, ...]: Coverage percentage for each field.
-    """
-    total = len(equities)
-    return tuple(_field_coverage_pct(equities, attr, total) for attr, _ in fields)
+        _EquityColumns: Populated flag matrices, market caps and sectors.
+    """
+    identity = [_IDENTITY_GETTER(vars(eq.identity)) for eq in equities]
+    financials = [_FINANCIAL_GETTER(vars(eq.financials)) for eq in equities]
+    return _EquityColumns(
+        identity_populated=_populated_matrix(identity, len(IDENTITY_ATTRS)),
+        financial_populated=_populated_matrix(financials, len(FINANCIAL_ATTRS)),
+        market_cap=np.array(
+            [row[_MARKET_CAP_INDEX] for row in financials],
+            dtype=np.float64,
+        ),
+        sector=np.array([row[_SECTOR_INDEX] for row in financials], dtype=object),
+    )
 
 
-def _field_coverage_pct(
-    equities: list[CanonicalEquity],
-    attr: str,
-    total: int,
-) -> float:
+def _populated_matrix(rows: list[tuple[object, ...]], width: int) -> np.ndarray:
     """
-    Compute coverage percentage for a single field.
+    Flag which fetched attribute values are populated.
 
     Args:
-        equities: Equities to check.
-        attr: Financial attribute name.
-        total: Total number of equities in the group.
+        rows: Field values fetched by a multi-field itemgetter, one
+            tuple per equity.
+        width: Number of fields in each row.
 
     Returns:
-        float: Percentage of equities with the field populated.
+        np.ndarray: Boolean matrix (equities x fields), True where not None.
+    """
+    flags = [value is not None for row in rows for value in row]
+    return np.array(flags, dtype=bool).reshape(-1, width)
+
+
+def _coverage_by_sector(
+    sector: np.ndarray,
+    populated: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
     """
-    if not total:
-        return 0.0
-    return sum(1 for eq in equities if has_field(eq, attr)) / total * 100
+    Compute per-field coverage percentages for every sector in one groupby.
+
+    Each equity with a known sector is given an integer sector code and
+    one-hot encoded, so the per-sector populated counts for every field
+    come from a single einsum contraction with the populated flags.
+
+    Args:
+        sector: Sector of each equity, None where missing.
+        populated: Populated flags (equities x fields).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Sorted sector names and their
+            coverage percentages (sectors x fields).
+    """
+    known = np.not_equal(sector, None)
+    names, codes = np.unique(sector[known], return_inverse=True)
+    onehot = np.zeros((len(codes), len(names)))
+    onehot[np.arange(len(codes)), codes] = 1.0
+    counts = np.einsum("ns,nf->sf", onehot, populated[known], optimize=True)
+    totals = np.bincount(codes, minlength=len(names))
+    return names, counts / totals[:, None] * 100
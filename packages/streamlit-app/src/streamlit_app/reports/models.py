@@ -2,6 +2,8 @@
 
 from typing import NamedTuple
 
+import numpy as np
+
 
 class FieldCoverage(NamedTuple):
     """
@@ -20,6 +22,7 @@ class CoverageReport(NamedTuple):
 
     total_equities: int
     snapshot_date: str | None
+    snapshot_date_formatted: str | None
     total_snapshots: int
     distinct_sectors: int
     distinct_industries: int
@@ -45,7 +48,7 @@ class MarketCapDistribution(NamedTuple):
     count: int
     median: float
     mean: float
-    values: tuple[float, ...]
+    values: np.ndarray
 
 
 class CompletenessDistribution(NamedTuple):
@@ -56,7 +59,7 @@ class CompletenessDistribution(NamedTuple):
     count: int
     median: float
     mean: float
-    values: tuple[int, ...]
+    values: np.ndarray
 
 
 class SectorFieldCoverage(NamedTuple):
@@ -1,7 +1,8 @@
 # renderers.py
 
-from datetime import date
+import functools
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -28,10 +29,8 @@ def render_header(report: CoverageReport) -> None:
         report: The coverage report data.
     """
     st.header("Integrity Report")
-    if report.snapshot_date:
-        parsed = date.fromisoformat(report.snapshot_date)
-        formatted = parsed.strftime("%d/%m/%Y")
-        st.caption(f"_Latest Snapshot Date: {formatted}_")
+    if report.snapshot_date_formatted:
+        st.caption(f"_Latest Snapshot Date: {report.snapshot_date_formatted}_")
 
 
 def render_summary(report: CoverageReport) -> None:
@@ -63,11 +62,10 @@ def render_coverage_table(
 
     Args:
         title: Subheading displayed at the top of the card.
-        coverage: Field coverage tuples to display.
+        coverage: Field coverage tuples to display, in display order.
         height: Optional fixed pixel height for the card container.
     """
     df = _build_coverage_dataframe(coverage)
-    df = df.sort_values("Coverage", ascending=False).reset_index(drop=True)
     container_kwargs = {"border": True, "gap": "medium"}
     if height is not None:
         container_kwargs["height"] = height
@@ -130,11 +128,10 @@ def render_consistency_card(
 
     Args:
         title: Subheading displayed at the top of the card.
-        findings: Consistency findings to display.
+        findings: Consistency findings to display, in display order.
         height: Optional fixed pixel height for the card container.
     """
     df = _build_consistency_dataframe(findings)
-    df = df.sort_values("Affected", ascending=False).reset_index(drop=True)
     container_kwargs = {"border": True, "gap": "medium"}
     if height is not None:
         container_kwargs["height"] = height
@@ -230,10 +227,15 @@ def _render_distribution_metrics(
     )
 
 
+@functools.lru_cache(maxsize=256)
 def _format_large_number(value: float) -> str:
     """
     Format a number with T/B/M abbreviations.
 
+    Note:
+        Results are memoised, since the same cached statistics are
+        reformatted on every rerun.
+
     Args:
         value: The numeric value to format.
 
@@ -262,13 +264,11 @@ def _build_coverage_dataframe(
         pd.DataFrame: DataFrame with Field and Coverage columns.
     """
     return pd.DataFrame(
-        [
-            {
-                "Field": fc.label,
-                "Coverage": (fc.count / fc.total * 100) if fc.total else 0,
-            }
-            for fc in coverage
-        ]
+        {
+            "Field": [fc.label for fc in coverage],
+            "Coverage": _percentages(coverage),
+        },
+        copy=False,
     )
 
 
@@ -284,8 +284,10 @@ def _overall_coverage(
     Returns:
         float: Weighted average coverage as a percentage.
     """
-    total_count = sum(fc.count for fc in coverage)
-    total_possible = sum(fc.total for fc in coverage)
+    total_count = total_possible = 0
+    for fc in coverage:
+        total_count += fc.count
+        total_possible += fc.total
     if not total_possible:
         return 0.0
     return total_count / total_possible * 100
@@ -304,16 +306,32 @@ def _build_consistency_dataframe(
         pd.DataFrame: DataFrame with Check and Affected columns.
     """
     return pd.DataFrame(
-        [
-            {
-                "Check": f.description,
-                "Affected": (f.count / f.total * 100) if f.total else 0,
-            }
-            for f in findings
-        ]
+        {
+            "Check": [f.description for f in findings],
+            "Affected": _percentages(findings),
+        },
+        copy=False,
     )
 
 
+def _percentages(
+    items: tuple[FieldCoverage, ...] | tuple[ConsistencyFinding, ...],
+) -> np.ndarray:
+    """
+    Convert count/total pairs to percentages in one vectorised division.
+
+    Args:
+        items: Field coverage tuples or consistency findings.
+
+    Returns:
+        np.ndarray: Percentage for each item, or 0 where the total is 0.
+    """
+    counts = np.fromiter((i.count for i in items), np.float64, len(items))
+    totals = np.fromiter((i.total for i in items), np.float64, len(items))
+    ratios = np.divide(counts, totals, out=np.zeros_like(counts), where=totals > 0)
+    return ratios * 100
+
+
 def _render_completeness_metrics(
     distribution: CompletenessDistribution,
 ) -> None: